@@ -0,0 +1,118 @@
+# Import libraries
+import sys
+import json
+import time
+import types
+import logging
+import argparse
+import threading
+import statistics
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Make the project modules importable when run from the benchmarks folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pyf16v5 import Controller  # noqa: E402
+
+
+# Minimal F16V5 stand-in that is slow to accept new connections
+class FakeControllerHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1  # send headers and body in one segment
+    fuses = {}
+    request_count = 0
+
+    def do_POST(self):
+        FakeControllerHandler.request_count += 1
+        request_json = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        method = request_json.get('M')
+        params = request_json.get('P')
+
+        if method == 'ST':
+            response_params = {'N': 'Bench F16V5', 'V': '1.00'}
+        elif method == 'CQ':
+            response_params = {'A': [{'p': port, 'r': receiver, 'f': state}
+                                     for (port, receiver), state in sorted(self.fuses.items())]}
+        else:
+            if method == 'TF':
+                key = (params.get('P'), params.get('R'))
+                self.fuses[key] = 1 - self.fuses[key]
+            response_params = {}
+
+        body = json.dumps({'B': 0, 'E': 0, 'I': 0, 'M': method, 'P': response_params, 'T': 'R'}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SlowAcceptServer(ThreadingHTTPServer):
+    daemon_threads = True
+    accept_delay = 0.0
+
+    def get_request(self):
+        # Emulate the embedded web server's connection setup cost
+        request = super().get_request()
+        time.sleep(self.accept_delay)
+        return request
+
+
+def run_fuse_operation(ip, logger, session, port_count):
+    # Reset the fake controller so every port is on
+    FakeControllerHandler.fuses = {(port, 0): 0 for port in range(port_count)}
+    FakeControllerHandler.request_count = 0
+
+    start = time.perf_counter()
+
+    # An owned pooled session is closed with the controller
+    with Controller(ip, logger, 3, session=session) as controller:
+        for fuse in controller.fuse_block.fuses:
+            controller.turn_off_fuse(fuse)
+
+    return time.perf_counter() - start, FakeControllerHandler.request_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pooled vs per-call connections for a multi-fuse command.')
+    parser.add_argument('--ports', type=int, help='Number of fuses to turn off', default=32)
+    parser.add_argument('--rounds', type=int, help='Number of timed rounds per mode', default=5)
+    parser.add_argument('--accept-delay', type=float,
+                        help='Simulated connection setup delay (in seconds)', default=0.01)
+    args = parser.parse_args()
+
+    logger = logging.getLogger('bench')
+    logger.addHandler(logging.NullHandler())
+
+    # Start the fake controller on a free loopback port
+    SlowAcceptServer.accept_delay = args.accept_delay
+    server = SlowAcceptServer(('127.0.0.1', 0), FakeControllerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ip = '127.0.0.1:{}'.format(server.server_address[1])
+
+    # Per-call connections (previous behaviour) vs a pooled keep-alive session
+    modes = {
+        'per-call': lambda: types.SimpleNamespace(post=requests.post, close=lambda: None),
+        'pooled': lambda: None,
+    }
+
+    results = {}
+    for mode, session_factory in modes.items():
+        rounds = [run_fuse_operation(ip, logger, session_factory(), args.ports) for _ in range(args.rounds)]
+        results[mode] = statistics.median(timing for timing, _ in rounds)
+        print('{:>9}: {:.1f} ms median over {} rounds ({} requests each)'.format(
+            mode, results[mode] * 1000, args.rounds, rounds[-1][1]))
+
+    print('  speedup: {:.1f}x'.format(results['per-call'] / results['pooled']))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# Import libraries
+import sys
+import json
+import time
+import argparse
+import threading
+import statistics
+import subprocess
+from pathlib import Path
+
+from bench_session import FakeControllerHandler, SlowAcceptServer
+
+# Project root (the child interpreters import the project modules from here)
+project_root = Path(__file__).resolve().parent.parent
+
+# Code timed in a fresh interpreter: import the CLI modules, then send one bulk command
+child_code = '''
+import time
+start = time.perf_counter()
+{extra_import}
+import sys, json, asyncio, logging
+from pyf16v5 import AsyncController
+import pyf16v5.cli  # noqa: F401
+imported = time.perf_counter()
+
+
+async def first_command():
+    async with AsyncController(sys.argv[1], logging.getLogger('bench'), 3) as controller:
+        await controller.turn_off_all_fuses()
+
+asyncio.run(first_command())
+done = time.perf_counter()
+print(json.dumps({{'import': imported - start, 'command': done - imported}}))
+'''
+
+
+def run_child(ip, extra_import):
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, '-c', child_code.format(extra_import=extra_import), ip],
+        cwd=project_root, capture_output=True, text=True, check=True
+    ).stdout
+    timings = json.loads(output)
+    timings['total'] = time.perf_counter() - start
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CLI startup: interpreter + imports + first command.')
+    parser.add_argument('--rounds', type=int, help='Number of fresh interpreters per mode', default=10)
+    parser.add_argument('--with-pandas', action='store_true',
+                        help='Also time a run that imports pandas (the previous default path)')
+    args = parser.parse_args()
+
+    # Start the fake controller on a free loopback port
+    FakeControllerHandler.fuses = {(port, 0): 0 for port in range(32)}
+    server = SlowAcceptServer(('127.0.0.1', 0), FakeControllerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ip = '127.0.0.1:{}'.format(server.server_address[1])
+
+    modes = {'default': ''}
+    if args.with_pandas:
+        modes['with pandas'] = 'import pandas'
+
+    for mode, extra_import in modes.items():
+        runs = [run_child(ip, extra_import) for _ in range(args.rounds)]
+        print('{:>12}: total {:.1f} ms | imports {:.1f} ms | first command {:.1f} ms (median of {})'.format(
+            mode,
+            statistics.median(run['total'] for run in runs) * 1000,
+            statistics.median(run['import'] for run in runs) * 1000,
+            statistics.median(run['command'] for run in runs) * 1000,
+            args.rounds))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+# Import libraries
+import sys
+import json
+import time
+import asyncio
+import logging
+import platform
+import argparse
+import threading
+import statistics
+import subprocess
+from pathlib import Path
+
+# Make the project modules importable when run from the benchmarks folder
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from pyf16v5 import Controller, AsyncController, ControllerFuseState, run_fleet  # noqa: E402
+from pyf16v5.cli import run_command  # noqa: E402
+from pyf16v5.simulator import start_simulators  # noqa: E402
+
+
+# Fuse layout of every simulated controller (32 ports, 2 receivers each)
+layout = '32x2'
+
+# The 32 fuses toggled one by one (receiver 0 of every port, so no bulk request applies)
+toggle_ports = ','.join('{}:0'.format(port) for port in range(1, 33))
+
+# Controller counts for the fleet fan-out scenarios
+fleet_sizes = (1, 10, 100)
+
+logger = logging.getLogger('bench')
+logger.addHandler(logging.NullHandler())
+logger.propagate = False
+
+
+def construct_controller(ip):
+    # A ready-to-use blocking controller (name / version and fuse details loaded)
+    with Controller(ip, logger, 3) as controller:
+        controller.refresh()
+
+
+def status_query(ip):
+    return asyncio.run(run_command(ip, 'status', 'all', 3))
+
+
+def single_fuse_toggle(ip):
+    async def toggle():
+        async with AsyncController(ip, logger, 3) as controller:
+            await controller.load(fuses=True)
+            await controller.turn_off_fuse(controller.fuse_block.find_fuse_in_block(1, 0))
+
+    asyncio.run(toggle())
+
+
+def many_fuse_toggle(ip):
+    return asyncio.run(run_command(ip, 'off', toggle_ports, 3))
+
+
+def bulk_off(ip):
+    async def turn_off():
+        async with AsyncController(ip, logger, 3) as controller:
+            await controller.turn_off_all_fuses()
+
+    asyncio.run(turn_off())
+
+
+def fleet_fan_out(ips):
+    async def fan_out():
+        results = await run_fleet(ips, lambda ip: run_command(ip, 'off', 'all', 3), len(ips))
+
+        if not all(result.ok for result in results):
+            raise Exception("Fleet fan-out failed: {}".format([result.error for result in results if not result.ok]))
+
+    return lambda _: asyncio.run(fan_out())
+
+
+def scenarios(addresses):
+    """Returns {name: (operation(ip), number of simulated controllers it touches)}"""
+    cases = {
+        'construct': (construct_controller, 1),
+        'status': (status_query, 1),
+        'toggle-1': (single_fuse_toggle, 1),
+        'toggle-32': (many_fuse_toggle, 1),
+        'bulk-off': (bulk_off, 1),
+    }
+    cases.update({'fleet-{}'.format(size): (fleet_fan_out(addresses[:size]), size) for size in fleet_sizes})
+
+    return cases
+
+
+def percentile(timings, percent):
+    # Inclusive percentiles need at least two samples
+    if len(timings) < 2:
+        return timings[0]
+
+    return statistics.quantiles(timings, n=100, method='inclusive')[percent - 1]
+
+
+def run_scenario(operation, ip, simulated, rounds, warmup):
+    """Times an operation over several rounds and counts the requests the simulators answered per round"""
+    timings = []
+    requests = 0
+
+    for round_index in range(warmup + rounds):
+        # Every round starts with all fuses on
+        for controller in simulated:
+            controller.fuses = dict.fromkeys(controller.fuses, ControllerFuseState.GOOD.value)
+
+        request_count = sum(controller.request_count for controller in simulated)
+        start = time.perf_counter()
+        operation(ip)
+        duration = time.perf_counter() - start
+
+        if round_index >= warmup:
+            timings.append(duration)
+            requests += sum(controller.request_count for controller in simulated) - request_count
+
+    return {
+        'rounds': rounds,
+        'p50_ms': percentile(timings, 50) * 1000,
+        'p95_ms': percentile(timings, 95) * 1000,
+        'p99_ms': percentile(timings, 99) * 1000,
+        'mean_ms': statistics.mean(timings) * 1000,
+        'requests': requests / rounds,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(results, baseline, threshold):
+    """Prints the change against a baseline run and returns the names of regressed scenarios"""
+    regressions = []
+
+    print('\nComparison with baseline ({}):'.format(baseline['meta'].get('revision')))
+    for name, result in results['scenarios'].items():
+        previous = baseline['scenarios'].get(name)
+        if previous is None:
+            print('{:>10}: new scenario'.format(name))
+            continue
+
+        change = result['p50_ms'] / previous['p50_ms'] - 1 if previous['p50_ms'] else 0.0
+        regressed = change > threshold or result['requests'] > previous['requests']
+        print('{:>10}: p50 {:+.1%}, requests {:g} -> {:g}{}'.format(
+            name, change, previous['requests'], result['requests'], '  REGRESSION' if regressed else ''))
+
+        if regressed:
+            regressions.append(name)
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark command latency and fleet throughput against simulated '
+                                                 'controllers.')
+    parser.add_argument('--rounds', type=int, help='Number of timed rounds per scenario', default=50)
+    parser.add_argument('--warmup', type=int, help='Number of untimed rounds per scenario', default=3)
+    parser.add_argument('--latency', type=float, help='Simulated controller latency (in seconds)', default=0.0)
+    parser.add_argument('--scenarios', help='Comma separated scenarios to run (default: all)')
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Baseline JSON file to compare the results against')
+    parser.add_argument('--threshold', type=float, help='Allowed p50 slowdown against the baseline (0.1 = 10%%)',
+                        default=0.1)
+    args = parser.parse_args()
+
+    # Run the simulated controllers on their own event loop thread
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    simulators = asyncio.run_coroutine_threadsafe(
+        start_simulators(logger, max(fleet_sizes), base_port=0, layout=layout, latency=args.latency), loop).result()
+    addresses = [address for address, _, _ in simulators]
+    simulated = [controller for _, controller, _ in simulators]
+
+    cases = scenarios(addresses)
+    names = args.scenarios.split(',') if args.scenarios else list(cases)
+
+    results = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'rounds': args.rounds,
+            'latency': args.latency,
+            'timestamp': time.time(),
+        },
+        'scenarios': {},
+    }
+
+    print('{:>10} {:>9} {:>9} {:>9} {:>9}'.format('scenario', 'p50 ms', 'p95 ms', 'p99 ms', 'requests'))
+    for name in names:
+        operation, size = cases[name]
+        result = run_scenario(operation, addresses[0], simulated[:size], args.rounds, args.warmup)
+        results['scenarios'][name] = result
+        print('{:>10} {:>9.2f} {:>9.2f} {:>9.2f} {:>9g}'.format(
+            name, result['p50_ms'], result['p95_ms'], result['p99_ms'], result['requests']))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    regressions = []
+    if args.compare:
+        regressions = compare_results(results, json.loads(Path(args.compare).read_text()), args.threshold)
+
+    loop.call_soon_threadsafe(loop.stop)
+
+    # Non-zero exit status when a scenario regressed against the baseline
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# Import libraries
+from .controller_classes import Controller, AsyncController, ControllerFuse, ControllerFuseBlock, ControllerFuseState, \
+    ControllerFuseStateIcon, create_session, pool_size_default
+from .planner import CommandPlan, PlannedCall, plan_command
+from .fleet import FleetResult, parse_targets, load_inventory, run_fleet, fleet_status_rows
+from .discovery import ControllerDetails, discover_controllers, write_inventory, load_inventory_details
+from .watch import FuseEvent, FuseWatcher, watch_fleet
+from .recovery import AutoRecovery
+from .sequencer import PowerUpWave, plan_power_up, run_power_up
+from .metrics import MetricsRegistry
+from .cache import ControllerCache
+from .transport import SessionTransport, AsyncTransport, MemoryTransport, AsyncMemoryTransport
+from .history import FuseHistory
+from .table import render_table
+
+__version__ = '0.2.0'
+
+__all__ = [
+    'Controller',
+    'AsyncController',
+    'ControllerFuse',
+    'ControllerFuseBlock',
+    'ControllerFuseState',
+    'ControllerFuseStateIcon',
+    'create_session',
+    'pool_size_default',
+    'CommandPlan',
+    'PlannedCall',
+    'plan_command',
+    'FleetResult',
+    'parse_targets',
+    'load_inventory',
+    'run_fleet',
+    'fleet_status_rows',
+    'ControllerDetails',
+    'discover_controllers',
+    'write_inventory',
+    'load_inventory_details',
+    'FuseEvent',
+    'FuseWatcher',
+    'watch_fleet',
+    'AutoRecovery',
+    'PowerUpWave',
+    'plan_power_up',
+    'run_power_up',
+    'MetricsRegistry',
+    'ControllerCache',
+    'SessionTransport',
+    'AsyncTransport',
+    'MemoryTransport',
+    'AsyncMemoryTransport',
+    'FuseHistory',
+    'render_table',
+]
@@ -0,0 +1,5 @@
+# Import libraries
+from .cli import run
+
+# Initiate main (python -m pyf16v5)
+run()
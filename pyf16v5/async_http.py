@@ -0,0 +1,218 @@
+# Import libraries
+from http import HTTPStatus
+import asyncio
+import json
+
+
+# Class for HTTP Responses
+class HTTPResponse:
+    def __init__(self, status, reason, headers, body) -> None:
+        self.status_code = status
+        self.reason = reason
+        self.headers = headers
+        self.content = body
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.content)
+
+
+# Class for HTTP Requests (server side)
+class HTTPRequest:
+    def __init__(self, method, path, headers, body, keep_alive) -> None:
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.content = body
+        self.keep_alive = keep_alive
+
+    def json(self):
+        return json.loads(self.content)
+
+
+async def read_headers(reader):
+    """Reads HTTP header lines up to the blank line (names are lower-cased)"""
+    headers = {}
+
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        key, _, value = line.decode('latin-1').partition(':')
+        headers[key.strip().lower()] = value.strip()
+
+    return headers
+
+
+async def read_request(reader):
+    """Reads one HTTP/1.1 request (None once the client closed the connection)"""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+
+    method, path, version = request_line.decode('latin-1').split()
+    headers = await read_headers(reader)
+    body = await reader.readexactly(int(headers.get('content-length', 0)))
+    keep_alive = headers.get('connection', '').lower() != 'close' and version != 'HTTP/1.0'
+
+    return HTTPRequest(method, path, headers, body, keep_alive)
+
+
+def write_response(writer, status, body=b'', keep_alive=True, content_type='application/json'):
+    """Writes one HTTP/1.1 response as a single segment"""
+    head = 'HTTP/1.1 {} {}\r\nContent-Type: {}\r\nContent-Length: {}\r\nConnection: {}\r\n\r\n'.format(
+        status,
+        HTTPStatus(status).phrase,
+        content_type,
+        len(body),
+        'keep-alive' if keep_alive else 'close'
+    )
+    writer.write(head.encode('latin-1') + body)
+
+
+def serve_connection(handler):
+    """Returns an asyncio.start_server callback answering every request with await handler(request)"""
+    async def handle_connection(reader, writer):
+        try:
+            # Keep-alive: answer requests until the client closes the connection or asks to
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+
+                # Handlers return (status, body) or (status, body, content type)
+                status, body, *content_type = await handler(request)
+                write_response(writer, status, body, request.keep_alive, *content_type)
+                await writer.drain()
+
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    return handle_connection
+
+
+# Class for a Pooled, Keep-Alive HTTP/1.1 Client built on asyncio streams
+class AsyncHTTPClient:
+    def __init__(self, host, port=80, pool_size=4, connect_timeout=3, read_timeout=3) -> None:
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.idle_connections = []
+        self.pool_size = pool_size
+        self.slots = None  # created on first use, inside the running event loop (required before Python 3.10)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes all idle pooled connections"""
+        while self.idle_connections:
+            _, writer = self.idle_connections.pop()
+            writer.close()
+
+    async def request(self, method, path, body=b'', headers=None, idempotent=False):
+        """Sends a request over a pooled connection and returns the response (idempotent ones may be re-sent)"""
+        # Build the request head once
+        request_headers = {
+            'Host': '{}:{}'.format(self.host, self.port) if self.port != 80 else self.host,
+            'Connection': 'keep-alive',
+            'Content-Length': str(len(body)),
+        }
+        request_headers.update(headers or {})
+        head = '{} {} HTTP/1.1\r\n{}\r\n'.format(
+            method,
+            path,
+            ''.join('{}: {}\r\n'.format(key, value) for key, value in request_headers.items())
+        )
+        request_bytes = head.encode('latin-1') + body
+
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.pool_size)
+
+        async with self.slots:
+            # Reused connections may have been dropped by the controller while idle: retry those once. A request
+            # that may have reached the controller is only re-sent when it is idempotent (fuse commands toggle state)
+            while True:
+                reader, writer, reused = await self.__acquire()
+                sent = False
+
+                try:
+                    writer.write(request_bytes)
+                    await writer.drain()
+                    sent = True
+                    response, keep_alive = await asyncio.wait_for(self.__read_response(reader), self.read_timeout)
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    writer.close()
+
+                    if reused and (not sent or idempotent and not getattr(e, 'partial', b'')):
+                        continue
+
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+
+                # Return the connection to the pool if the server allows it
+                if keep_alive:
+                    self.idle_connections.append((reader, writer))
+                else:
+                    writer.close()
+
+                return response
+
+    async def __acquire(self):
+        # Prefer an idle connection that is still open
+        while self.idle_connections:
+            reader, writer = self.idle_connections.pop()
+
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+
+            writer.close()
+
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.connect_timeout)
+
+        return reader, writer, False
+
+    @staticmethod
+    async def __read_response(reader):
+        # Status line
+        status_line = await reader.readline()
+        if not status_line:
+            raise asyncio.IncompleteReadError(b'', None)
+
+        version, status, reason = (status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+
+        # Headers
+        headers = await read_headers(reader)
+        keep_alive = headers.get('connection', '').lower() != 'close' and version != 'HTTP/1.0'
+
+        # Body
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        return HTTPResponse(int(status), reason, headers, body), keep_alive
@@ -0,0 +1,89 @@
+# Import libraries
+from pathlib import Path
+import json
+import os
+import time
+
+
+# Default time cached controller details stay valid (in seconds). They only change on firmware updates
+cache_ttl_default = 86400.0
+
+
+# Class for an On-Disk Controller Details Cache (name, version and fuse layout per controller address)
+class ControllerCache:
+    def __init__(self, path, logger, ttl=cache_ttl_default, clock=time.time) -> None:
+        self.path = Path(path)
+        self.logger = logger
+        self.ttl = ttl
+        self.clock = clock
+        self.changed = False
+        self.layout_keys = {}
+        self.entries = self.__load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.save()
+
+    def __load(self):
+        try:
+            entries = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            # A damaged cache only costs the details queries it would have saved
+            self.logger.warning("Ignoring unreadable controller cache '%s': %s", self.path, e)
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, ip):
+        """Returns the cached (name, version) of a controller, or None when missing or expired"""
+        entry = self.entries.get(ip)
+
+        if entry is None or self.clock() - entry.get('time', 0) > self.ttl:
+            return None
+
+        self.logger.debug("Using cached details for controller at '%s'", ip)
+        return entry.get('name'), entry.get('version')
+
+    def store(self, ip, name, version):
+        """Records the details queried from a controller (keeping its known fuse layout)"""
+        layout = self.entries.get(ip, {}).get('layout')
+        self.entries[ip] = {'name': name, 'version': version, 'layout': layout, 'time': self.clock()}
+        self.changed = True
+
+    def check_layout(self, ip, fuse_block):
+        """Records the fuse layout of a controller, dropping its cached details when the layout changed"""
+        # Polls mostly repeat the layout already checked
+        layout_key = fuse_block.port_ids.tobytes() + fuse_block.receivers.tobytes()
+        if self.layout_keys.get(ip) == layout_key and self.entries.get(ip, {}).get('layout') is not None:
+            return
+        self.layout_keys[ip] = layout_key
+
+        layout = [[port_id + 1, receiver] for port_id, receiver in zip(fuse_block.port_ids, fuse_block.receivers)]
+        entry = self.entries.setdefault(ip, {})
+
+        # The fuse details may arrive before the controller details (both are queried concurrently)
+        if entry.get('layout') is None:
+            entry['layout'] = layout
+            self.changed = True
+        elif entry['layout'] != layout:
+            self.logger.info("Fuse layout of controller at '%s' changed, dropping its cached details", ip)
+            self.invalidate(ip)
+
+    def invalidate(self, ip):
+        """Drops the cached details of a controller"""
+        if self.entries.pop(ip, None) is not None:
+            self.changed = True
+
+    def save(self):
+        """Writes the cache back to disk when it changed (replacing the file, so readers never see a partial one)"""
+        if not self.changed:
+            return
+
+        temporary_path = self.path.with_name(self.path.name + '.tmp')
+        temporary_path.write_text(json.dumps(self.entries), encoding='utf-8')
+        os.replace(temporary_path, self.path)
+        self.changed = False
@@ -0,0 +1,657 @@
+# Import libraries
+from .controller_classes import AsyncController, pool_size_default
+from .planner import plan_command
+from .table import render_table
+from .recovery import AutoRecovery, reset_limit_default, reset_window_default
+from .watch import watch_min_interval_default, watch_max_interval_default, watch_fleet, stdout_event_writer, \
+    log_event_writer
+from .fleet import concurrency_default, parse_targets, load_inventory, run_fleet, fleet_status_rows
+from .metrics import MetricsRegistry, start_metrics_server
+from .history import FuseHistory
+from .sequencer import wave_size_default, wave_delay_default, load_supply_map, plan_power_up, run_power_up, \
+    describe_power_up
+from .cache import ControllerCache, cache_ttl_default
+from .output import output_formats, create_output_writer
+from .session import fuse_max_age_default, port_list_pattern, session_help, ControllerSession, parse_step, \
+    load_script, read_lines
+from .discovery import discovery_timeout_default, discovery_concurrency_default, discover_controllers, \
+    write_inventory, load_inventory_details
+import asyncio  # async io
+import sys  # exit
+import platform  # platform
+import argparse  # argument parsing
+import time  # timing
+import logging  # Logging
+from logging.handlers import QueueHandler, QueueListener  # Non-blocking log handlers
+import queue  # log queue
+import atexit  # exit hooks
+from pathlib import Path  # Path functions
+
+# Set a default command response timeout (in seconds)
+command_timeout_default = 3
+
+# List of valid device command options
+command_options = ['on', 'off', 'reset', 'status', 'watch', 'discover', 'session']
+
+# List of valid watch event outputs
+event_output_options = ['stdout', 'log']
+
+
+def positive_int(value):
+    # Counts and sizes must be at least 1 (0 would split nothing or block forever)
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1: {}".format(value))
+
+    return number
+
+
+def build_parser():
+    # CMD Line Parser
+    parser = argparse.ArgumentParser(prog='pyf16v5', description='Control a Falcon F16V5 Pixel Controller.')
+    target_group = parser.add_mutually_exclusive_group(required=True)
+    target_group.add_argument('--ip', help='The IP address of the controller, or a list of addresses, ranges and CIDR '
+                                           'blocks (example: 10.0.0.5,10.0.0.10-20,10.0.1.0/28)')
+    target_group.add_argument('--inventory',
+                              help='File listing controller addresses, ranges or CIDR blocks (one per line), or '
+                                   'written by the discover command')
+    parser.add_argument('--command', help='Command to run (session runs commands typed at a prompt, or --script)',
+                        choices=command_options)
+    parser.add_argument('--ports', help='List of port:receiver values to run command against (example: 0:0,1:1,2:2)',
+                        default="all")
+    parser.add_argument('--timeout', type=int,
+                        help='Timeout for command (in seconds)', default=command_timeout_default)
+    parser.add_argument('--connect-timeout', type=float,
+                        help='Timeout for opening a connection (in seconds). Defaults to --timeout if omitted')
+    parser.add_argument('--pool-size', type=positive_int,
+                        help='Number of keep-alive connections to pool per controller', default=pool_size_default)
+    parser.add_argument('--concurrency', type=positive_int,
+                        help='Maximum number of controllers to command at the same time', default=concurrency_default)
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Show the planned requests for the command without sending them')
+    parser.add_argument('--verify', action='store_true',
+                        help='Re-read the fuse details once after the command and report fuses not in the requested '
+                             'state')
+    parser.add_argument('--verify-retries', type=int,
+                        help='Number of times --verify re-sends the command to mismatched fuses only', default=0)
+    parser.add_argument('--staged', action='store_true',
+                        help='Turn fuses on in waves per power supply instead of all at once (on command only)')
+    parser.add_argument('--wave-size', type=positive_int,
+                        help='Number of fuses per supply switched on per wave with --staged', default=wave_size_default)
+    parser.add_argument('--wave-delay', type=float, help='Settle time between the waves of a supply with --staged '
+                                                         '(in seconds)', default=wave_delay_default)
+    parser.add_argument('--supply-map', help='File mapping controller ports to power supplies for --staged '
+                                             '(lines like: PSU1 = 10.0.0.5:1-16; 10.0.0.6:1-8)')
+    parser.add_argument('--watch-min-interval', type=float,
+                        help='Fastest polling interval for the watch command (in seconds)',
+                        default=watch_min_interval_default)
+    parser.add_argument('--watch-max-interval', type=float,
+                        help='Slowest polling interval for the watch command (in seconds)',
+                        default=watch_max_interval_default)
+    parser.add_argument('--events', help='Where the watch command writes fuse state changes',
+                        choices=event_output_options, default='stdout')
+    parser.add_argument('--auto-reset', action='store_true',
+                        help='Automatically reset tripped fuses during the watch command')
+    parser.add_argument('--auto-reset-limit', type=int,
+                        help='Maximum fuse resets per controller per window', default=reset_limit_default)
+    parser.add_argument('--auto-reset-window', type=float,
+                        help='Window for --auto-reset-limit (in seconds)', default=reset_window_default)
+    parser.add_argument('--script', help='Run the commands in this file (one per line, like: off 1:0,2:0) in a single '
+                                         'session. Implies --command session')
+    parser.add_argument('--fuse-max-age', type=float,
+                        help='Age up to which a session reuses fuse details instead of re-reading them before a '
+                             'command (in seconds)', default=fuse_max_age_default)
+    parser.add_argument('--output', help='Format of the command results: the logged status table, or fuse rows '
+                                         'streamed to stdout as each controller completes',
+                        choices=output_formats, default='table')
+    parser.add_argument('--metrics-json', help="Write request and fuse metrics as JSON to this file ('-' for stdout) "
+                                               "once the command completes")
+    parser.add_argument('--metrics-listen', help='Serve Prometheus metrics at http://HOST:PORT/metrics during the '
+                                                 'watch command (example: 127.0.0.1:9516)')
+    parser.add_argument('--history', help='Append the fuse states read by the status and watch commands to this '
+                                          'history file')
+    parser.add_argument('--discovery-timeout', type=float,
+                        help='Timeout for probing each address with the discover command (in seconds)',
+                        default=discovery_timeout_default)
+    parser.add_argument('--discovery-concurrency', type=positive_int,
+                        help='Maximum number of addresses the discover command probes at the same time',
+                        default=discovery_concurrency_default)
+    parser.add_argument('--write-inventory', help='Write the controllers found by the discover command to this '
+                                                  'inventory file')
+    parser.add_argument('--cache', help='Cache the controller names / versions and fuse layouts in this file, so '
+                                        'repeated runs skip the details queries')
+    parser.add_argument('--cache-ttl', type=float, help='Time the cached controller details stay valid (in seconds)',
+                        default=cache_ttl_default)
+    parser.add_argument('--log', help='File path for log file. Defaults to script folder if omitted')
+    parser.add_argument('--debug', type=bool, help='Verbose mode for debugging', nargs='?', const=True)
+
+    return parser
+
+
+# Logger shared by the CLI functions (handlers are only added by config_logger)
+loggerName = "pyf16v5"
+logger = logging.getLogger(loggerName)
+
+
+# Functions
+async def run_command(controller_ip, command, port_receiver_list_string, command_timeout, connect_timeout=None,
+                      pool_size=pool_size_default, dry_run=False, metrics=None, verify=False, verify_retries=0,
+                      details=None, cache=None):
+    # Access the controller (its pooled connections are closed once the command completes)
+    async with AsyncController(controller_ip, logger, command_timeout, connect_timeout, pool_size,
+                               metrics=metrics, cache=cache) as controller:
+        # Name / version recorded by discovery
+        if details is not None:
+            details.apply(controller)
+
+        return await execute_command(controller, command, port_receiver_list_string, dry_run, verify, verify_retries)
+
+
+async def execute_command(controller, command, port_receiver_list_string, dry_run=False, verify=False,
+                          verify_retries=0):
+    fuse_list = None
+
+    # Commands on all fuses are planned blind as a single bulk request, anything else needs the fuse details. Missing
+    # controller details (not in the inventory or cache) are queried alongside them, so results carry the name
+    if port_receiver_list_string != "all" or command == "status":
+        await controller.load(details=True, fuses=True)
+        fuse_list = select_fuses(controller, port_receiver_list_string)
+
+    # Run command on target device(s)
+    logger.info('Command: %s', command)
+
+    # Plan the fewest requests for the command
+    plan = plan_command(command, fuse_list if port_receiver_list_string != "all" else None,
+                        controller.fuse_block if fuse_list is not None else None, logger)
+    if dry_run:
+        logger.info(plan.describe())
+    else:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(plan.describe())
+        await plan.execute(controller)
+
+        # One re-read replaces the assumed fuse states with the actual ones
+        if verify and plan.calls:
+            await plan.verify(controller, verify_retries, logger)
+            fuse_list = controller.fuse_block.fuses if fuse_list is None else \
+                [fuse for fuse in (controller.fuse_block.find_fuse_in_block(fuse.port, fuse.receiver)
+                                   for fuse in fuse_list) if fuse is not None]
+
+    return controller, fuse_list
+
+
+async def run_watch(controller_ips, port_receiver_list_string, command_timeout, connect_timeout=None,
+                    pool_size=pool_size_default, concurrency=concurrency_default,
+                    min_interval=watch_min_interval_default, max_interval=watch_max_interval_default,
+                    event_output='stdout', auto_reset=False, reset_limit=reset_limit_default,
+                    reset_window=reset_window_default, metrics=None, metrics_listen=None, history=None,
+                    inventory=None, cache=None):
+    # Limit events to the selected fuses
+    fuses = None
+    if port_receiver_list_string != "all":
+        fuses = {tuple(int(value) for value in port_receiver.split(':'))
+                 for port_receiver in port_receiver_list_string.split(',')}
+
+    # Keep one controller (and its pooled connections) alive per address for the whole watch
+    controllers = [AsyncController(controller_ip, logger, command_timeout, connect_timeout, pool_size, metrics=metrics,
+                                   cache=cache)
+                   for controller_ip in controller_ips]
+    apply_inventory(controllers, inventory, cache)
+    event_writer = stdout_event_writer if event_output == 'stdout' else log_event_writer(logger)
+    recovery = AutoRecovery(logger, reset_limit=reset_limit, reset_window=reset_window) if auto_reset else None
+
+    # Expose the metrics for scraping while watching
+    metrics_server = None
+    if metrics_listen:
+        host, _, port = metrics_listen.rpartition(':')
+        metrics_server = await start_metrics_server(metrics, host, int(port))
+        logger.info('Serving metrics at http://%s/metrics', metrics_listen)
+
+    logger.info('Watching %s controller(s) for fuse state changes...', len(controllers))
+
+    try:
+        await watch_fleet(controllers, logger, event_writer, concurrency,
+                          min_interval=min_interval,
+                          max_interval=max_interval,
+                          fuses=fuses,
+                          recovery=recovery,
+                          history=history)
+    finally:
+        for controller in controllers:
+            await controller.close()
+
+        if metrics_server is not None:
+            metrics_server.close()
+
+
+async def run_staged_power_up(controller_ips, port_receiver_list_string, command_timeout, connect_timeout=None,
+                              pool_size=pool_size_default, concurrency=concurrency_default,
+                              wave_size=wave_size_default, wave_delay=wave_delay_default, supply_map=None,
+                              dry_run=False, metrics=None, inventory=None, cache=None):
+    # Keep every controller open until all supplies are up
+    controllers = {controller_ip: AsyncController(controller_ip, logger, command_timeout, connect_timeout, pool_size,
+                                                  metrics=metrics, cache=cache)
+                   for controller_ip in controller_ips}
+    apply_inventory(controllers.values(), inventory)
+
+    async def load_fuses(controller_ip):
+        controller = controllers[controller_ip]
+        await controller.load(details=True, fuses=True)
+
+        return controller, select_fuses(controller, port_receiver_list_string)
+
+    try:
+        # Read the fuse details of every controller, then schedule the waves across all of them
+        results = await run_fleet(controller_ips, load_fuses, concurrency)
+        schedule = plan_power_up({result.controller: result.fuses for result in results if result.ok}, wave_size,
+                                 supply_map, logger)
+
+        if dry_run:
+            logger.info(describe_power_up(schedule, wave_delay))
+        else:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(describe_power_up(schedule, wave_delay))
+            failed_supplies = await run_power_up(schedule, wave_delay, logger)
+
+            # Controllers on a supply whose power-up stopped are reported as failed
+            for result in results:
+                supplies = [supply for supply in failed_supplies
+                            if any(controller is result.controller for wave in schedule[supply]
+                                   for controller, _ in wave.fuses)]
+
+                if result.ok and supplies:
+                    result.error = Exception("Power-up stopped on supply group(s): {}".format(', '.join(supplies)))
+    finally:
+        for controller in controllers.values():
+            await controller.close()
+
+    return results
+
+
+async def run_discover(targets, timeout=discovery_timeout_default, concurrency=discovery_concurrency_default,
+                       inventory_path=None, metrics=None):
+    # Probe every address, then report (and optionally record) the controllers found
+    start = time.perf_counter()
+    controllers = await discover_controllers(targets, logger, timeout, concurrency, metrics)
+    logger.info('Found %s controller(s) in %s address(es) in %.2fs', len(controllers), len(targets),
+                time.perf_counter() - start)
+
+    if controllers:
+        logger.info('Discovered Controllers:\n%s', render_table([vars(details) for details in controllers],
+                                                                ['ip', 'name', 'version', 'layout']))
+
+    if inventory_path:
+        write_inventory(inventory_path, controllers)
+        logger.info("Inventory written to '%s'", inventory_path)
+
+    return controllers
+
+
+async def run_session(controller_ips, steps=None, command_timeout=command_timeout_default, connect_timeout=None,
+                      pool_size=pool_size_default, concurrency=concurrency_default, dry_run=False, metrics=None,
+                      verify=False, verify_retries=0, inventory=None, cache=None, output_writer=None,
+                      fuse_max_age=fuse_max_age_default):
+    # One controller (and its pooled connections and fuse details) per address for the whole session
+    controllers = {controller_ip: AsyncController(controller_ip, logger, command_timeout, connect_timeout, pool_size,
+                                                  metrics=metrics, cache=cache)
+                   for controller_ip in controller_ips}
+    apply_inventory(controllers.values(), inventory)
+    session = ControllerSession(controllers.values(), logger, fuse_max_age)
+
+    async def run_step(step):
+        if step.command == 'wait':
+            await asyncio.sleep(step.seconds)
+            return
+
+        async def run_on_controller(controller_ip):
+            controller = controllers[controller_ip]
+            await session.prepare(controller, step)
+
+            if step.command == 'refresh':
+                return controller, controller.fuse_block.fuses
+
+            result = await execute_command(controller, step.command, step.ports, dry_run, verify, verify_retries)
+            session.completed(controller, result[1])
+
+            return result
+
+        start = time.perf_counter()
+        results = await run_fleet(controller_ips, run_on_controller, concurrency,
+                                  output_writer.write if output_writer is not None else None)
+        logger.debug("'%s' completed on %s controller(s) in %.2fs", step, len(results), time.perf_counter() - start)
+
+        # A refresh only reports failures and totals
+        show_command_results(results, output_writer is None and step.command != 'refresh', dry_run)
+
+    try:
+        if steps is not None:
+            # Script: the steps were checked before the session started
+            for index, step in enumerate(steps, 1):
+                logger.info('Step %s of %s (line %s): %s', index, len(steps), step.line, step)
+                await run_step(step)
+            return
+
+        # Interactive: one command per line until quit or end of input
+        print(session_help)
+        async for text in read_lines('pyf16v5> '):
+            if text.strip().lower() in ('quit', 'exit'):
+                break
+
+            if text.strip().lower() in ('help', '?'):
+                print(session_help)
+                continue
+
+            try:
+                step = parse_step(text)
+            except ValueError as e:
+                logger.error('%s', e)
+                continue
+
+            if step is not None:
+                await run_step(step)
+    finally:
+        await session.close()
+
+
+def apply_inventory(controllers, inventory, cache=None):
+    # Skip the details queries for controllers recorded by discovery (or cached by earlier runs)
+    for controller in controllers:
+        details = inventory.get(controller.ip) if inventory else None
+        cached = cache.get(controller.ip) if details is None and cache is not None else None
+
+        if details is not None:
+            details.apply(controller)
+        elif cached is not None:
+            controller.name, controller.version = cached
+            controller.details_loaded = True
+
+
+def select_fuses(controller, port_receiver_list_string):
+    # Show controller details
+    logger.info('Controller Details: %s', controller)
+
+    # Get list of ports / receivers to run command against
+    port_receiver_list = []
+    fuse_list = []
+
+    # Parse the list of ports provided
+    if port_receiver_list_string != "all":
+        port_receiver_list = port_receiver_list_string.split(',')
+
+        for port_receiver in port_receiver_list:
+            current_port_receiver = port_receiver.split(':')
+            current_port = int(current_port_receiver[0])
+            current_receiver = int(current_port_receiver[1])
+
+            try:
+                # Look for a valid fuse with the give Port and Receiver values
+                fuse = controller.fuse_block.find_fuse_in_block(current_port, current_receiver)
+
+                if fuse:
+                    # Valid fuse. Added to command action list
+                    logger.debug('Added - Port ID: %s | Port: %s | Receiver: %s',
+                                 fuse.port_id,
+                                 fuse.port,
+                                 fuse.receiver)
+
+                    fuse_list.append(fuse)
+                else:
+                    logger.error("No fuse found at Port: %s | Receiver %s. Skipping...", current_port, current_receiver)
+            except Exception as e:
+                logger.error('Could not query for use at Port: %s | Receiver: %s -- %s',
+                             current_port,
+                             current_receiver,
+                             e)
+    else:
+        # Add full set of fuses to command action list
+        logger.debug("All ports will be used!")
+
+        fuse_list = controller.fuse_block.fuses
+
+    # Show port list (only rendered when debug output is enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Port List: \n%s',
+                     render_table([fuse.to_dict() for fuse in fuse_list], ['port', 'receiver', 'state']))
+
+    return fuse_list
+
+
+def show_command_results(results, show_table=True, dry_run=False):
+    # Streamed output already holds the fuse rows, so only the failures and totals are logged
+    if not show_table:
+        for result in results:
+            if not result.ok:
+                logger.error("Controller at '%s' failed after %.2fs: %s", result.ip, result.duration, result.error)
+
+        logger.info('%s of %s controllers succeeded', sum(result.ok for result in results), len(results))
+        return
+
+    if len(results) == 1:
+        result = results[0]
+
+        if not result.ok:
+            logger.critical('Error: %s', result.error)
+            return
+
+        if result.fuses is None:
+            if dry_run:
+                logger.info("Dry run: command planned for all fuses on controller at '%s' (nothing sent)", result.ip)
+            else:
+                logger.info("Command sent to all fuses on controller at '%s'", result.ip)
+            return
+
+        # Show status of selected fuses (unchanged by a dry run)
+        fuses_sorted = sorted(result.fuses, key=lambda x: x.port_id)  # sort the fuse list
+        fuse_table = render_table([fuse.to_dict() for fuse in fuses_sorted], ['port', 'receiver', 'state'])
+        logger.info('%s:\n%s', 'Current Fuse Status (dry run, nothing sent)' if dry_run else 'Updated Fuse Status',
+                    fuse_table)  # print the table
+        return
+
+    # Report failed controllers
+    for result in results:
+        if not result.ok:
+            logger.error("Controller at '%s' failed after %.2fs: %s", result.ip, result.duration, result.error)
+
+    # Show merged status of every controller
+    fleet_table = render_table(fleet_status_rows(results, dry_run), ['ip', 'name', 'port', 'receiver', 'state'])
+    logger.info('%s:\n%s', 'Current Fleet Fuse Status (dry run, nothing sent)' if dry_run else
+                'Updated Fleet Fuse Status', fleet_table)
+    logger.info('%s of %s controllers succeeded', sum(result.ok for result in results), len(results))
+
+
+def write_metrics_json(metrics, metrics_path):
+    # One-shot metrics dump for the CLI
+    if metrics_path == '-':
+        print(metrics.to_json())
+    else:
+        Path(metrics_path).write_text(metrics.to_json(), encoding='utf-8')
+
+
+def config_logger(log_name_prefix, log_level, log_path):
+    # Log path existence / creation
+    Path(log_path).mkdir(parents=True, exist_ok=True)
+
+    # Log filename
+    log_file_name = '{}/{}.log'.format(log_path, log_name_prefix)
+
+    # Get logger
+    my_logger = logging.getLogger(loggerName)
+
+    # Set lowest allowed logger severity (debug messages are not even formatted unless enabled)
+    logger.setLevel(log_level)
+
+    # Console output handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s | %(levelname)s: %(message)s'))
+    logger.addHandler(console_handler)
+
+    # Log file output handler
+    file_handler = logging.FileHandler(log_file_name, encoding='utf-8')
+    file_handler.setLevel(log_level)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s | %(levelname)s | %(lineno)d: %(message)s'))
+
+    # Queue the file output so a background thread does the disk writes and slow disks never stall commands
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    logger.addHandler(queue_handler)
+
+    queue_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    queue_listener.start()
+    atexit.register(queue_listener.stop)  # flush queued messages on exit
+
+    # Return configured logger
+    return my_logger
+
+
+# Main function
+async def main(argv=None):
+    # Get CMD Args
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    # A script always runs as a session
+    if args.script and not args.command:
+        args.command = 'session'
+    if not args.command:
+        parser.error('the following arguments are required: --command')
+    log_level = logging.DEBUG if args.debug else logging.INFO
+    log_path = args.log if args.log else "."
+
+    # Configure logging (same pyF16V5.log whichever entry point started the CLI)
+    logger = config_logger('pyF16V5', log_level, log_path)
+
+    # Get command timeout
+    command_timeout = args.timeout
+
+    # Expand the list of controller addresses
+    try:
+        device_ips = load_inventory(args.inventory) if args.inventory else parse_targets(args.ip)
+        inventory = load_inventory_details(args.inventory) if args.inventory else {}
+    except (OSError, ValueError) as e:
+        logger.critical('Invalid controller list: %s', e)
+        sys.exit()
+
+    if not device_ips:
+        logger.critical('No controller addresses provided')
+        sys.exit()
+
+    # Check if port list is valid
+    if port_list_pattern.match(args.ports):
+        port_list = args.ports
+    else:
+        # Port list parsing failure
+        logger.critical('Invalid Port List: %s', args.ports)
+        sys.exit()
+
+    #  Get command from CMD args
+    command = args.command
+
+    # Check every step of a script before anything is sent
+    steps = None
+    if args.script:
+        try:
+            steps = load_script(args.script)
+        except (OSError, ValueError) as e:
+            logger.critical('Invalid script: %s', e)
+            sys.exit()
+
+    # Only record metrics when they are reported
+    metrics = MetricsRegistry() if args.metrics_json or args.metrics_listen else None
+
+    # Fuse state history
+    history = FuseHistory(args.history, logger) if args.history else None
+
+    # Streamed command results (stdout, while the log goes to stderr)
+    output_writer = create_output_writer(args.output, dry_run=args.dry_run) \
+        if command in ('on', 'off', 'reset', 'status', 'session') else None
+
+    # Controller details cache (saved even when a watch is interrupted)
+    cache = ControllerCache(args.cache, logger, args.cache_ttl) if args.cache else None
+
+    try:
+        # Check for valid command
+        if command == "discover":
+            # Probe the addresses for controllers
+            await run_discover(device_ips, args.discovery_timeout, args.discovery_concurrency, args.write_inventory,
+                               metrics)
+        elif command == "session":
+            # Keep the controllers open across the script / typed commands
+            await run_session(device_ips, steps, command_timeout, args.connect_timeout, args.pool_size,
+                              args.concurrency, args.dry_run, metrics, args.verify, args.verify_retries, inventory,
+                              cache, output_writer, args.fuse_max_age)
+        elif command == "watch":
+            # Watch the controllers until interrupted
+            await run_watch(device_ips, port_list, command_timeout, args.connect_timeout, args.pool_size,
+                            args.concurrency, args.watch_min_interval, args.watch_max_interval, args.events,
+                            args.auto_reset, args.auto_reset_limit, args.auto_reset_window, metrics,
+                            args.metrics_listen, history, inventory, cache)
+        elif command == "on" and args.staged:
+            # Turn fuses on in waves per power supply
+            try:
+                supply_map = load_supply_map(args.supply_map) if args.supply_map else None
+            except (OSError, ValueError) as e:
+                logger.critical('Invalid supply map: %s', e)
+                sys.exit()
+
+            results = await run_staged_power_up(device_ips, port_list, command_timeout, args.connect_timeout,
+                                                args.pool_size, args.concurrency, args.wave_size, args.wave_delay,
+                                                supply_map, args.dry_run, metrics, inventory, cache)
+
+            # The fuse states are only final once every wave ran
+            if output_writer is not None:
+                for result in results:
+                    output_writer.write(result)
+
+            show_command_results(results, output_writer is None, args.dry_run)
+        elif command in command_options:
+            # Run command on every controller (bounded number at a time)
+            start = time.perf_counter()
+            results = await run_fleet(
+                device_ips,
+                lambda device_ip: run_command(device_ip, command, port_list, command_timeout, args.connect_timeout,
+                                              args.pool_size, args.dry_run, metrics, args.verify, args.verify_retries,
+                                              inventory.get(device_ip), cache),
+                args.concurrency,
+                output_writer.write if output_writer is not None else None
+            )
+            logger.debug('Command completed on %s controller(s) in %.2fs', len(results), time.perf_counter() - start)
+
+            show_command_results(results, output_writer is None, args.dry_run)
+
+            # Record the states read by a status command
+            if history is not None and command == "status":
+                for result in results:
+                    if result.ok:
+                        history.record(result.ip, result.controller.fuse_block)
+        else:
+            logger.critical('Invalid command: %s', command)
+            sys.exit()
+
+        # One metrics dump for whichever command ran
+        if args.metrics_json:
+            write_metrics_json(metrics, args.metrics_json)
+    finally:
+        if output_writer is not None:
+            output_writer.close()
+
+        if cache is not None:
+            cache.save()
+
+
+def run(argv=None):
+    """Console entry point"""
+    # Set platform policy
+    if platform.system() == 'Windows':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    try:
+        asyncio.run(main(argv))
+    except KeyboardInterrupt:
+        pass
+
+
+# Initiate main
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,761 @@
+# Import libraries
+from enum import Enum
+from array import array
+from itertools import compress
+import operator
+from .async_http import AsyncHTTPClient
+from .transport import SessionTransport, AsyncTransport, encode_payload, read_response
+from .table import render_table
+import logging
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Class for Controller Fuse (a lightweight view of one fuse of a ControllerFuseBlock, found by port / receiver)
+class ControllerFuse:
+    __slots__ = ('block', 'key')
+
+    def __init__(self, block, key) -> None:
+        self.block = block
+        self.key = key  # (port, receiver), so the view stays on its fuse when the block's rows move
+
+    def __repr__(self):
+        return "ControllerFuse(port_id={}, port={}, receiver={}, state={}, icon={})".format(
+            self.port_id,
+            self.port,
+            self.receiver,
+            self.state,
+            self.icon
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, ControllerFuse):
+            return NotImplemented
+
+        return (self.port_id, self.receiver, self.state) == (other.port_id, other.receiver, other.state)
+
+    __hash__ = None
+
+    @property
+    def port_id(self):
+        return self.key[0] - 1
+
+    @property
+    def port(self):
+        return self.key[0]
+
+    @property
+    def receiver(self):
+        return self.key[1]
+
+    @property
+    def state(self):
+        return fuse_states[self.__state_code()]
+
+    @state.setter
+    def state(self, state):
+        # A fuse the controller no longer reports has no row to update
+        row = self.block.index.get(self.key)
+        if row is not None:
+            self.block.states[row] = ControllerFuseState(state).value
+
+    @property
+    def icon(self):
+        return fuse_state_icons[self.__state_code()]
+
+    def __state_code(self):
+        row = self.block.index.get(self.key)
+
+        return self.block.states[row] if row is not None else ControllerFuseState.UNKNOWN.value
+
+    def set_state(self, state):
+        self.state = state
+
+    def to_dict(self):
+        return {
+            'port': self.port,
+            'receiver': self.receiver,
+            'state': self.state,
+        }
+
+
+# Class for Fuse States
+class ControllerFuseState(Enum):
+    UNKNOWN = -1
+    GOOD = 0
+    OFF = 1
+    TRIPPED = 2
+
+    def __str__(self):
+        return self.name
+
+
+# Class for Fuse State Icons
+class ControllerFuseStateIcon(Enum):
+    U = -1
+    O = 0
+    _ = 1
+    X = 2
+
+    def __str__(self):
+        return self.name
+
+
+# Fuse state / icon lookups by raw state code
+fuse_states = {state.value: state for state in ControllerFuseState}
+fuse_state_icons = {icon.value: icon for icon in ControllerFuseStateIcon}
+
+
+# Class for Controller Fuse Block (columnar port / receiver / state arrays with a (port, receiver) index)
+class ControllerFuseBlock:
+    def __init__(self, fuses, logger) -> None:
+        self.logger = logger
+        self.port_ids = array('H')
+        self.receivers = array('H')
+        self.states = array('b')
+        self.index = {}
+        self.__build_fuse_block(fuses)
+
+    def __build_fuse_block(self, fuses):
+        self.logger.debug("Fuses Output: %s", fuses)
+
+        for fuse in fuses:
+            fuse_num = fuse.get("p")
+            fuse_receiver = fuse.get("r")
+            fuse_state = ControllerFuseState(fuse.get("f")).value
+
+            # Keep the first fuse reported for a port / receiver pair
+            self.index.setdefault((fuse_num + 1, fuse_receiver), len(self.states))
+            self.port_ids.append(fuse_num)
+            self.receivers.append(fuse_receiver)
+            self.states.append(fuse_state)
+
+    def __len__(self):
+        return len(self.states)
+
+    def refresh(self, fuses):
+        """Applies new fuse details in place and returns (port, receiver, previous state, state) for every change"""
+        ports = array('H', (fuse.get("p") for fuse in fuses))
+        receivers = array('H', (fuse.get("r") for fuse in fuses))
+
+        # Same fuses as before (the usual case): only the states that changed are touched
+        if ports == self.port_ids and receivers == self.receivers:
+            changes = []
+
+            for row, fuse in enumerate(fuses):
+                state = fuse.get("f")
+
+                if state != self.states[row]:
+                    state = ControllerFuseState(state).value
+                    changes.append((ports[row] + 1, receivers[row], fuse_states[self.states[row]], fuse_states[state]))
+                    self.states[row] = state
+
+            self.logger.debug("Fuse block refreshed: %s change(s)", len(changes))
+            return changes
+
+        # Receivers were added or removed: only the rows of those fuses are removed / inserted
+        keys = [(port_id + 1, receiver) for port_id, receiver in zip(ports, receivers)]
+        previous = {key: self.states[row] for key, row in self.index.items()}
+        reported = set(keys)
+
+        for row in reversed(range(len(self.states))):
+            if (self.port_ids[row] + 1, self.receivers[row]) not in reported:
+                del self.port_ids[row], self.receivers[row], self.states[row]
+
+        for row, key in enumerate(keys):
+            if key not in previous:
+                self.port_ids.insert(row, ports[row])
+                self.receivers.insert(row, receivers[row])
+                self.states.insert(row, ControllerFuseState.UNKNOWN.value)
+
+        # Remaining fuses reported in a new order (or repeated) are rewritten to the reported order
+        if ports != self.port_ids or receivers != self.receivers:
+            self.port_ids[:] = ports
+            self.receivers[:] = receivers
+            self.states[:] = array('b', (previous.get(key, ControllerFuseState.UNKNOWN.value) for key in keys))
+
+        self.index.clear()
+        for row, key in enumerate(keys):
+            self.index.setdefault(key, row)
+
+        # Apply the reported states and list the changes (None for fuses added or removed)
+        changes = []
+        for row, fuse in enumerate(fuses):
+            key = keys[row]
+            state = ControllerFuseState(fuse.get("f")).value
+            self.states[row] = state
+
+            if self.index[key] == row and previous.get(key) != state:
+                changes.append((key[0], key[1], fuse_states[previous[key]] if key in previous else None,
+                                fuse_states[state]))
+        changes.extend((key[0], key[1], fuse_states[state], None) for key, state in previous.items()
+                       if key not in reported)
+
+        self.logger.debug("Fuse block layout changed: %s change(s)", len(changes))
+        return changes
+
+    @property
+    def fuses(self):
+        return [ControllerFuse(self, (port_id + 1, receiver))
+                for port_id, receiver in zip(self.port_ids, self.receivers)]
+
+    def to_rows(self):
+        return [{
+            'port': port_id + 1,
+            'receiver': receiver,
+            'state': fuse_states[state],
+        } for port_id, receiver, state in zip(self.port_ids, self.receivers, self.states)]
+
+    def to_table(self):
+        return render_table(self.to_rows(), ['port', 'receiver', 'state'])
+
+    def to_dataframe(self):
+        # pandas is optional and only imported when a DataFrame is requested
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("pandas is required for ControllerFuseBlock.to_dataframe() (pip install pandas)")
+
+        return pandas.DataFrame({
+            'port': [port_id + 1 for port_id in self.port_ids],
+            'receiver': self.receivers.tolist(),
+            'state': [fuse_states[state] for state in self.states],
+        })
+
+    def get_fuse_block(self):
+        return self.to_dataframe()
+
+    def find_fuse_in_block(self, port, receiver):
+        row = self.index.get((port, receiver))
+
+        self.logger.debug('Fuse Block lookup for Port: %s | Receiver: %s -> row %s', port, receiver, row)
+
+        return ControllerFuse(self, (port, receiver)) if row is not None else None
+
+    def select_rows(self, states=None, ports=None, receivers=None):
+        """Returns the rows matching the given fuse state(s), port(s) and receiver(s)"""
+        filters = []
+
+        if states is not None:
+            states = [states] if isinstance(states, (ControllerFuseState, int)) else states
+            filters.append((self.states, {ControllerFuseState(state).value for state in states}))
+
+        if ports is not None:
+            ports = [ports] if isinstance(ports, int) else ports
+            filters.append((self.port_ids, {port - 1 for port in ports}))
+
+        if receivers is not None:
+            filters.append((self.receivers, {receivers} if isinstance(receivers, int) else set(receivers)))
+
+        # Build one boolean mask across the columns (evaluated lazily, without per-row Python loops)
+        mask = None
+        for column, values in filters:
+            column_mask = map(values.__contains__, column)
+            mask = column_mask if mask is None else map(operator.and_, mask, column_mask)
+
+        rows = range(len(self.states))
+
+        return list(rows) if mask is None else list(compress(rows, mask))
+
+    def select(self, states=None, ports=None, receivers=None):
+        """Returns the fuses matching the given fuse state(s), port(s) and receiver(s)"""
+        return [ControllerFuse(self, (self.port_ids[row] + 1, self.receivers[row]))
+                for row in self.select_rows(states, ports, receivers)]
+
+    def count_by_state(self):
+        """Returns the number of fuses in each fuse state"""
+        return {state: self.states.count(state.value) for state in ControllerFuseState}
+
+
+# Fuse states each fuse action leaves a fuse in
+fuse_action_states = {
+    'on': ControllerFuseState.GOOD,
+    'off': ControllerFuseState.OFF,
+    'reset': ControllerFuseState.GOOD,
+}
+
+
+# Checks whether a fuse action ('on', 'off' or 'reset') would change the fuse
+def fuse_action_required(fuse, action, logger):
+    if action == 'reset':
+        if fuse.state in (ControllerFuseState.GOOD, ControllerFuseState.OFF):
+            logger.info("Fuse at Port: %s, Receiver: %s is not tripped!", fuse.port, fuse.receiver)
+            return False
+    elif fuse.state is fuse_action_states[action]:
+        logger.info("Fuse at Port: %s, Receiver: %s is already %s!", fuse.port, fuse.receiver, action)
+        return False
+    elif fuse.state is ControllerFuseState.TRIPPED:
+        logger.info("Fuse at Port: %s, Receiver: %s is tripped and must be reset!", fuse.port, fuse.receiver)
+        return False
+
+    if fuse.state is ControllerFuseState.UNKNOWN:
+        logger.info("Fuse at Port: %s, Receiver: %s is in an unknown state!", fuse.port, fuse.receiver)
+        return False
+
+    return True
+
+
+# Default number of pooled connections kept open per controller
+pool_size_default = 4
+
+
+# Builds a keep-alive HTTP session with a bounded connection pool
+def create_session(pool_size=pool_size_default):
+    # requests is only needed by the blocking Controller, so the async CLI path never imports it
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+
+    # Pooled adapter (no automatic retries, since fuse commands toggle state)
+    adapter_options = {
+        'pool_connections': pool_size,
+        'pool_maxsize': pool_size,
+        'max_retries': 0
+    }
+    adapter = HTTPAdapter(**adapter_options)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Ask the controller to keep the connection open between calls
+    session.headers.update({'Connection': 'keep-alive'})
+
+    return session
+
+
+# Requests of the fuse actions: (API method, log message, error message)
+fuse_action_requests = {
+    'on': ("TF", "Turning on fuse at Port: %s, Receiver: %s", "Error turning on controller fuse"),
+    'off': ("TF", "Turning off fuse at Port: %s, Receiver: %s", "Error turning off controller fuse"),
+    'reset': ("FR", "Resetting fuse at Port: %s, Receiver: %s", "Error resetting controller fuse"),
+}
+
+# Requests of the bulk fuse actions: (API method, parameters, log message, error message)
+bulk_action_requests = {
+    'on': ("FT", {"T": 1}, "Turning on all fuses on controller at '%s'", "Error turning on controller fuses"),
+    'off': ("FT", {"T": 0}, "Turning off all fuses on controller at '%s'", "Error turning off controller fuses"),
+    'reset': ("FR", {}, "Resetting all tripped fuses on controller at '%s'", "Error resetting controller fuses"),
+}
+
+
+# Class for the state and request handling shared by Controller and AsyncController (they only add the I/O)
+class BaseController:
+    def __init__(self, ip, logger, metrics=None, cache=None) -> None:
+        self.ip = ip
+        self.logger = logger
+        self.metrics = metrics
+        self.cache = cache
+
+        # Controller details and fuses are queried on demand
+        self._name = None
+        self._version = None
+        self._fuse_block = None
+        self.fuses_read_at = None
+        self.details_loaded = False
+
+    def __str__(self):
+        return "IP: {} | Name: {} | Version: {}".format(
+            self.ip,
+            self._name,
+            self._version
+        )
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def version(self):
+        return self._version
+
+    @version.setter
+    def version(self, version):
+        self._version = version
+
+    @property
+    def fuse_block(self):
+        return self._fuse_block
+
+    def _use_cached_details(self):
+        # Cached details save the query
+        cached = self.cache.get(self.ip) if self.cache is not None else None
+
+        if cached is not None:
+            self._name, self._version = cached
+            self.details_loaded = True
+
+        return cached is not None
+
+    def _observe_request(self, method, payload, start, response=None, error=None):
+        # Records one API call in the metrics registry (for every transport)
+        duration = time.perf_counter() - start
+
+        if response is not None:
+            self.metrics.observe_request(self.ip, method, response.status_code, duration, len(payload),
+                                         len(response.content))
+        elif isinstance(error, getattr(self.transport, 'timeout_errors', (TimeoutError,))):
+            self.metrics.observe_request(self.ip, method, 'timeout', duration, len(payload), timed_out=True)
+        else:
+            self.metrics.observe_request(self.ip, method, 'error', duration, len(payload))
+
+    def _read_response(self, response, error_message):
+        # An error response drops the cached controller details
+        if not response.ok and self.cache is not None:
+            self.cache.invalidate(self.ip)
+
+        return read_response(response, self.ip, error_message, self.logger)
+
+    def _apply_details(self, response_json):
+        # Set controller details
+        self._name = response_json.get("P").get("N")
+        self._version = response_json.get("P").get("V")
+        self.details_loaded = True
+        self.logger.debug("Controller '%s' running version '%s' found at '%s'", self._name, self._version, self.ip)
+        if self.cache is not None:
+            self.cache.store(self.ip, self._name, self._version)
+
+    def _apply_fuses(self, response_json):
+        self.fuses_read_at = time.monotonic()
+
+        # Set controller fuse (the first query builds the block, later ones only apply the changes)
+        if self._fuse_block is None:
+            self.logger.debug("Generating Fuse Block Details...")
+            self._fuse_block = ControllerFuseBlock(response_json.get("P").get("A"), self.logger)
+            changes = None
+        else:
+            changes = self._fuse_block.refresh(response_json.get("P").get("A"))
+
+        if self.metrics is not None:
+            self.metrics.set_fuse_counts(self.ip, self._fuse_block.count_by_state())
+        if self.cache is not None:
+            self.cache.check_layout(self.ip, self._fuse_block)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Controller '%s' fuse details:", self._name)
+            self.logger.debug('Fuse Block Details:\n%s', self._fuse_block.to_table())
+
+        return changes or []
+
+    def _bulk_request(self, action):
+        # Returns the (method, parameters, message type, error message) of a bulk fuse action
+        method, params, message, error_message = bulk_action_requests[action]
+        self.logger.info(message, self.ip)
+
+        return method, params, "S", error_message
+
+    def _fuse_request(self, fuse, action):
+        # Returns the (method, parameters, message type, error message) of a fuse action, or None if not needed
+        if not fuse_action_required(fuse, action, self.logger):
+            return None
+
+        method, message, error_message = fuse_action_requests[action]
+        self.logger.info(message, fuse.port, fuse.receiver)
+
+        return method, {"P": fuse.port_id, "R": fuse.receiver}, "S", error_message
+
+
+# Class for Controller Instance
+class Controller(BaseController):
+    # Constructor
+    def __init__(self, ip, logger, request_timeout, connect_timeout=None, pool_size=pool_size_default,
+                 session=None, metrics=None, cache=None, transport=None):
+        super().__init__(ip, logger, metrics, cache)
+
+        # Separate connect / read timeouts (connect defaults to the request timeout)
+        self.timeout = (connect_timeout if connect_timeout is not None else request_timeout, request_timeout)
+
+        # Use the given transport, otherwise post over a shared session or an owned pooled one
+        self.owns_transport = transport is None and session is None
+        self.transport = transport if transport is not None else SessionTransport(
+            session if session is not None else create_session(pool_size),
+            "http://{}/api".format(self.ip),
+            self.timeout
+        )
+
+    # Controller details and fuses are queried on first access (or by refresh())
+    @property
+    def name(self):
+        if not self.details_loaded:
+            self.__load_controller_details()
+
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def version(self):
+        if not self.details_loaded:
+            self.__load_controller_details()
+
+        return self._version
+
+    @version.setter
+    def version(self, version):
+        self._version = version
+
+    @property
+    def fuse_block(self):
+        if self._fuse_block is None:
+            self.__get_controller_fuses()
+
+        return self._fuse_block
+
+    def refresh(self, details=True, fuses=True, concurrent=True):
+        """Re-queries the controller details and / or fuse details"""
+        queries = []
+
+        if details:
+            queries.append(self.__get_controller_details)
+
+        if fuses:
+            queries.append(self.__get_controller_fuses)
+
+        # Both queries are independent, so they can share the connection pool in parallel
+        if concurrent and len(queries) > 1:
+            with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                for future in [executor.submit(query) for query in queries]:
+                    future.result()
+        else:
+            for query in queries:
+                query()
+
+    def refresh_fuses(self):
+        """Re-queries the fuse details, updates the known fuses in place and returns the changed fuses"""
+        return self.__get_controller_fuses()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the pooled controller connections"""
+        if self.owns_transport:
+            self.transport.close()
+
+    def send(self, method, params, message_type, error_message="Error sending request"):
+        """Sends one API request (method code, parameters, message type) and returns the response JSON"""
+        payload = encode_payload(method, params, message_type)
+        start = time.perf_counter()
+
+        # Send the request and record the response
+        try:
+            response = self.transport.send(method, payload)
+        except Exception as e:
+            if self.metrics is not None:
+                self._observe_request(method, payload, start, error=e)
+            raise
+
+        if self.metrics is not None:
+            self._observe_request(method, payload, start, response)
+
+        return self._read_response(response, error_message)
+
+    def __load_controller_details(self):
+        if not self._use_cached_details():
+            self.__get_controller_details()
+
+    def __get_controller_details(self):
+        """Returns Controller details from the IP address provided"""
+        self.logger.info("Querying for controller at '%s'", self.ip)
+
+        self._apply_details(self.send("ST", {}, "Q", "Error getting controller details"))
+
+    def __get_controller_fuses(self):
+        """Returns Controller fuse details"""
+        self.logger.debug("Querying fuse details for '%s' controller at '%s'", self._name, self.ip)
+
+        return self._apply_fuses(self.send("CQ", {}, "Q", "Error getting controller fuse details"))
+
+    def __bulk_action(self, action):
+        self.send(*self._bulk_request(action))
+
+        return True
+
+    def __fuse_action(self, fuse, action):
+        request = self._fuse_request(fuse, action)
+
+        if request is not None:
+            self.send(*request)
+
+            # Update controller fuse status
+            fuse.set_state(fuse_action_states[action])
+
+        return True
+
+    def turn_off_all_fuses(self):
+        """Turns Off All Controller Fuses"""
+        return self.__bulk_action('off')
+
+    def turn_on_all_fuses(self):
+        """Turns On All Controller Fuses"""
+        return self.__bulk_action('on')
+
+    def reset_all_fuses(self):
+        """Resets All Tripped Controller Fuses"""
+        return self.__bulk_action('reset')
+
+    def turn_on_fuse(self, fuse):
+        """Turns On Controller Fuse for a Specific Port"""
+        return self.__fuse_action(fuse, 'on')
+
+    def turn_off_fuse(self, fuse):
+        """Turns Off Controller Fuse for a Specific Port"""
+        return self.__fuse_action(fuse, 'off')
+
+    def reset_fuse(self, fuse):
+        """Reset Controller Fuse for a Specific Port"""
+        return self.__fuse_action(fuse, 'reset')
+
+
+# Class for Asynchronous Controller Instance
+class AsyncController(BaseController):
+    # Constructor
+    def __init__(self, ip, logger, request_timeout, connect_timeout=None, pool_size=pool_size_default,
+                 client=None, metrics=None, cache=None, transport=None):
+        super().__init__(ip, logger, metrics, cache)
+
+        # Addresses may carry a path prefix (e.g. a caching proxy at 'proxy:8080/10.0.0.5')
+        address, _, path_prefix = ip.partition('/')
+        host, _, port = address.partition(':')
+        self.path = '/{}/api'.format(path_prefix) if path_prefix else '/api'
+
+        # Use the given transport, otherwise post over a shared client or an owned pooled one
+        self.owns_transport = transport is None and client is None
+        if transport is None:
+            transport = AsyncTransport(client if client is not None else AsyncHTTPClient(
+                host,
+                int(port) if port else 80,
+                pool_size,
+                connect_timeout if connect_timeout is not None else request_timeout,
+                request_timeout
+            ), self.path)
+        self.transport = transport
+
+    # The fuse details are only queried by refresh(), load() or get_controller_fuses()
+    @property
+    def fuse_block(self):
+        return self._fuse_block
+
+    @fuse_block.setter
+    def fuse_block(self, fuse_block):
+        self._fuse_block = fuse_block
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the pooled controller connections"""
+        if self.owns_transport:
+            await self.transport.close()
+
+    async def send(self, method, params, message_type, error_message="Error sending request"):
+        """Sends one API request (method code, parameters, message type) and returns the response JSON"""
+        payload = encode_payload(method, params, message_type)
+        start = time.perf_counter()
+
+        # Send the request and record the response
+        try:
+            response = await self.transport.send(method, payload)
+        except Exception as e:
+            if self.metrics is not None:
+                self._observe_request(method, payload, start, error=e)
+            raise
+
+        if self.metrics is not None:
+            self._observe_request(method, payload, start, response)
+
+        return self._read_response(response, error_message)
+
+    async def refresh(self, details=True, fuses=True):
+        """Re-queries the controller details and / or fuse details (concurrently when both are requested)"""
+        queries = []
+
+        if details:
+            queries.append(self.get_controller_details())
+
+        if fuses:
+            queries.append(self.get_controller_fuses())
+
+        await asyncio.gather(*queries)
+
+    async def load(self, details=False, fuses=False):
+        """Queries the controller details and / or fuse details only if they were not fetched (or cached) yet"""
+        if details and not self.details_loaded:
+            self._use_cached_details()
+
+        await self.refresh(details and not self.details_loaded, fuses and self._fuse_block is None)
+
+    async def get_controller_details(self):
+        """Queries the controller name and version"""
+        self.logger.info("Querying for controller at '%s'", self.ip)
+
+        self._apply_details(await self.send("ST", {}, "Q", "Error getting controller details"))
+
+    async def get_controller_fuses(self):
+        """Queries the controller fuse details (updating the known ones in place) and returns the changed fuses"""
+        self.logger.debug("Querying fuse details for '%s' controller at '%s'", self._name, self.ip)
+
+        return self._apply_fuses(await self.send("CQ", {}, "Q", "Error getting controller fuse details"))
+
+    async def __bulk_action(self, action):
+        await self.send(*self._bulk_request(action))
+
+        return True
+
+    async def __fuse_action(self, fuse, action):
+        request = self._fuse_request(fuse, action)
+
+        if request is not None:
+            await self.send(*request)
+
+            # Update controller fuse status
+            fuse.set_state(fuse_action_states[action])
+
+        return True
+
+    async def turn_off_all_fuses(self):
+        """Turns Off All Controller Fuses"""
+        return await self.__bulk_action('off')
+
+    async def turn_on_all_fuses(self):
+        """Turns On All Controller Fuses"""
+        return await self.__bulk_action('on')
+
+    async def reset_all_fuses(self):
+        """Resets All Tripped Controller Fuses"""
+        return await self.__bulk_action('reset')
+
+    async def turn_on_fuse(self, fuse):
+        """Turns On Controller Fuse for a Specific Port"""
+        return await self.__fuse_action(fuse, 'on')
+
+    async def turn_off_fuse(self, fuse):
+        """Turns Off Controller Fuse for a Specific Port"""
+        return await self.__fuse_action(fuse, 'off')
+
+    async def reset_fuse(self, fuse):
+        """Reset Controller Fuse for a Specific Port"""
+        return await self.__fuse_action(fuse, 'reset')
+
+    async def turn_on_fuses(self, fuses):
+        """Turns On a Set of Controller Fuses concurrently"""
+        return await asyncio.gather(*(self.turn_on_fuse(fuse) for fuse in fuses))
+
+    async def turn_off_fuses(self, fuses):
+        """Turns Off a Set of Controller Fuses concurrently"""
+        return await asyncio.gather(*(self.turn_off_fuse(fuse) for fuse in fuses))
+
+    async def reset_fuses(self, fuses):
+        """Resets a Set of Controller Fuses concurrently"""
+        return await asyncio.gather(*(self.reset_fuse(fuse) for fuse in fuses))
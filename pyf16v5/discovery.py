@@ -0,0 +1,107 @@
+# Import libraries
+from dataclasses import dataclass
+from .controller_classes import AsyncController
+from .fleet import run_fleet
+
+
+# Default probe timeout (in seconds) and number of addresses probed at the same time
+discovery_timeout_default = 0.5
+discovery_concurrency_default = 128
+
+# First line of a discovered inventory file
+inventory_header = '# ip\tname\tversion\tlayout (written by pyf16v5 --command discover)'
+
+
+# Class for the details of a discovered controller
+@dataclass
+class ControllerDetails:
+    ip: str
+    name: str
+    version: str
+    layout: str  # receivers per port, 'PORTSxRECEIVERS' (e.g. 16x2) or a list of counts (e.g. 4,4,1)
+
+    def apply(self, controller):
+        """Sets the controller name / version so they are not queried again"""
+        controller.name = self.name
+        controller.version = self.version
+        controller.details_loaded = True
+
+
+def is_controller_status(response_json):
+    # F16V5 status responses carry the controller name and version
+    parameters = response_json.get('P') if isinstance(response_json, dict) else None
+
+    return isinstance(parameters, dict) and 'N' in parameters and 'V' in parameters
+
+
+def fuse_layout(fuse_block):
+    """Returns the receivers per port of a fuse block as 'PORTSxRECEIVERS' or a list of counts"""
+    receivers = {}
+
+    for fuse in fuse_block.fuses:
+        receivers[fuse.port] = max(receivers.get(fuse.port, 0), fuse.receiver + 1)
+
+    counts = [receivers.get(port, 0) for port in range(1, max(receivers, default=0) + 1)]
+    if counts and len(set(counts)) == 1:
+        return '{}x{}'.format(len(counts), counts[0])
+
+    return ','.join(str(count) for count in counts)
+
+
+async def probe_controller(ip, logger, timeout=discovery_timeout_default, metrics=None):
+    """Identifies an F16V5 controller by its status response and reads its fuse layout"""
+    async with AsyncController(ip, logger, timeout, metrics=metrics) as controller:
+        response_json = await controller.send("ST", {}, "Q", "Error probing controller")
+
+        if not is_controller_status(response_json):
+            raise Exception("No F16V5 controller at '{}'".format(ip))
+
+        ControllerDetails(ip, response_json['P']['N'], response_json['P']['V'], None).apply(controller)
+        await controller.get_controller_fuses()
+
+    return controller, None
+
+
+async def discover_controllers(targets, logger, timeout=discovery_timeout_default,
+                               concurrency=discovery_concurrency_default, metrics=None):
+    """Probes every address concurrently and returns the details of the controllers that answered"""
+    logger.info('Probing %s address(es) for controllers...', len(targets))
+
+    results = await run_fleet(targets, lambda ip: probe_controller(ip, logger, timeout, metrics), concurrency)
+
+    # Unreachable addresses and other devices are expected while scanning
+    for result in results:
+        if not result.ok:
+            logger.debug("No controller at '%s': %s", result.ip, result.error)
+
+    return [ControllerDetails(result.ip, result.controller.name, result.controller.version,
+                              fuse_layout(result.controller.fuse_block))
+            for result in results if result.ok]
+
+
+def write_inventory(inventory_path, controllers):
+    """Writes discovered controllers as tab separated 'ip name version layout' inventory lines"""
+    lines = [inventory_header]
+    lines.extend('\t'.join((details.ip, details.name or '', details.version or '', details.layout))
+                 for details in controllers)
+
+    with open(inventory_path, 'w', encoding='utf-8') as inventory_file:
+        inventory_file.write('\n'.join(lines) + '\n')
+
+
+def load_inventory_details(inventory_path):
+    """Reads the controller details recorded in an inventory file into {ip: ControllerDetails}"""
+    inventory = {}
+
+    with open(inventory_path, encoding='utf-8') as inventory_file:
+        for line in inventory_file:
+            if line.lstrip().startswith('#'):
+                continue
+
+            # Hand written lines (addresses, ranges and CIDR blocks) carry no details
+            columns = line.rstrip('\r\n').split('\t')
+            if len(columns) == 4:
+                details = ControllerDetails(*(column.strip() for column in columns))
+                inventory[details.ip] = details
+
+    return inventory
@@ -0,0 +1,155 @@
+# Import libraries
+from dataclasses import dataclass
+from typing import List
+import ipaddress
+import asyncio
+import time
+import re
+
+
+# Default number of controllers commanded at the same time
+concurrency_default = 16
+
+# One label of a DNS host name
+hostname_label = re.compile(r'^(?!-)[A-Za-z0-9-]{1,63}(?<!-)$')
+
+
+# Class for the result of a command on one controller of the fleet
+@dataclass
+class FleetResult:
+    ip: str
+    controller: object = None
+    fuses: List = None
+    error: Exception = None
+    duration: float = 0.0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def parse_address(target):
+    """Validates a host:port[/path] address (IPv4 address or host name) and returns it normalised"""
+    address, slash, path = target.partition('/')
+    host, colon, port_string = address.rpartition(':')
+
+    if not colon or not host or (slash and not path.strip('/')):
+        raise ValueError("Invalid address (expected host:port[/path]): {}".format(target))
+
+    # Port
+    try:
+        port = int(port_string)
+    except ValueError:
+        port = 0
+
+    if not 1 <= port <= 65535:
+        raise ValueError("Invalid port in address: {}".format(target))
+
+    # Host, either an IP address or a host name (an all-numeric name must be a valid IPv4 address)
+    try:
+        ipaddress.IPv4Address(host)
+    except ValueError:
+        labels = host.rstrip('.').split('.')
+
+        if len(host) > 253 or labels[-1].isdigit() or not all(hostname_label.match(label) for label in labels):
+            raise ValueError("Invalid host in address: {}".format(target))
+
+    return '{}:{}{}{}'.format(host, port, slash, path)
+
+
+def parse_targets(target_string):
+    """Expands a comma separated list of IPs, ranges (a.b.c.d-e or a.b.c.d-a.b.c.e), CIDR blocks and host:port[/path]"""
+    ips = []
+
+    for target in target_string.split(','):
+        target = target.strip()
+
+        if not target:
+            continue
+
+        if ':' in target:
+            # Address with a port (optionally a proxied controller path)
+            addresses = [parse_address(target)]
+        elif '/' in target:
+            # CIDR block (a single address for /32)
+            network = ipaddress.IPv4Network(target, strict=False)
+            addresses = list(network.hosts()) if network.num_addresses > 1 else [network.network_address]
+        elif '-' in target:
+            # Address range, either full end address or last octet only
+            start_string, end_string = target.split('-', 1)
+            start = ipaddress.IPv4Address(start_string.strip())
+
+            if '.' in end_string:
+                end = ipaddress.IPv4Address(end_string.strip())
+            else:
+                end = ipaddress.IPv4Address('{}.{}'.format(str(start).rsplit('.', 1)[0], end_string.strip()))
+
+            if end < start:
+                raise ValueError("Invalid IP range: {}".format(target))
+
+            addresses = [start + offset for offset in range(int(end) - int(start) + 1)]
+        else:
+            addresses = [ipaddress.IPv4Address(target)]
+
+        ips.extend(str(address) for address in addresses)
+
+    # Drop duplicates while keeping the requested order
+    return list(dict.fromkeys(ips))
+
+
+def load_inventory(inventory_path):
+    """Reads controller targets from an inventory file (one IP, range or CIDR block per line, # for comments)"""
+    with open(inventory_path, encoding='utf-8') as inventory_file:
+        # Discovered inventories add tab separated controller details after the address
+        targets = [line.split('#', 1)[0].split('\t', 1)[0].strip() for line in inventory_file]
+
+    return parse_targets(','.join(target for target in targets if target))
+
+
+async def run_fleet(ips, action, concurrency=concurrency_default, on_result=None):
+    """Runs an async action(ip) -> (controller, fuses) on every controller, at most `concurrency` at a time"""
+    slots = asyncio.Semaphore(concurrency)
+
+    async def run_on_controller(ip):
+        result = FleetResult(ip)
+
+        async with slots:
+            start = time.perf_counter()
+
+            try:
+                result.controller, result.fuses = await action(ip)
+            except Exception as e:
+                result.error = e
+
+            result.duration = time.perf_counter() - start
+
+        # Hand each result over as soon as its controller completes (e.g. to stream the output)
+        if on_result is not None:
+            on_result(result)
+
+        return result
+
+    return await asyncio.gather(*(run_on_controller(ip) for ip in ips))
+
+
+def fleet_status_rows(results, dry_run=False):
+    """Merges the fuse status of every controller into one list of table rows"""
+    rows = []
+
+    for result in results:
+        name = result.controller.name if result.controller else None
+
+        if not result.ok:
+            rows.append({'ip': result.ip, 'name': name, 'port': '-', 'receiver': '-', 'state': 'ERROR'})
+            continue
+
+        # Bulk commands do not read the fuse state back (and a dry run only planned them)
+        if result.fuses is None:
+            rows.append({'ip': result.ip, 'name': name, 'port': 'all', 'receiver': 'all',
+                         'state': 'PLANNED' if dry_run else 'SENT'})
+            continue
+
+        for fuse in sorted(result.fuses, key=lambda x: (x.port_id, x.receiver)):
+            rows.append({'ip': result.ip, 'name': name, **fuse.to_dict()})
+
+    return rows
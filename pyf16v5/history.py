@@ -0,0 +1,249 @@
+# Import libraries
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from pathlib import Path
+from .controller_classes import ControllerFuseState, fuse_states
+import contextlib
+import struct
+import mmap
+import time
+
+
+# Fixed-width records: timestamp, controller id, port, receiver, state, flags (16 bytes)
+record_format = struct.Struct('<dHBBbB2x')
+timestamp_format = struct.Struct('<d')
+
+# File header: magic, format version, record size (16 bytes, so records stay aligned)
+header_format = struct.Struct('<8sII')
+history_magic = b'F16V5HST'
+history_version = 1
+
+# Record flags
+record_changed = 1  # the state differs from the previous record of the fuse
+record_snapshot = 2  # part of a full snapshot of the controller's fuses
+
+# Default time between full snapshots of a controller (in seconds)
+snapshot_interval_default = 3600.0
+
+# Records decoded per read while scanning
+scan_chunk_records = 65536
+
+
+# Class for a sequence view of the record timestamps (so bisect can search the mapped file)
+class RecordTimestamps:
+    def __init__(self, buffer, count) -> None:
+        self.buffer = buffer
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        return timestamp_format.unpack_from(self.buffer, header_format.size + index * record_format.size)[0]
+
+
+# Class for an Append-Only Fuse State History (change-only records, memory-mapped for queries)
+class FuseHistory:
+    def __init__(self, path, logger, snapshot_interval=snapshot_interval_default, read_only=False) -> None:
+        self.path = Path(path)
+        self.controllers_path = Path('{}.controllers'.format(path))
+        self.logger = logger
+        self.snapshot_interval = snapshot_interval
+        self.read_only = read_only  # queries only: never creates or appends to the file
+        self.controller_ids = {}
+        self.controller_ips = []
+        self.last_states = {}
+        self.last_snapshots = {}
+        self.last_blocks = {}
+        self.last_timestamp = 0.0
+        self.file = None
+        self.__open()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __open(self):
+        if self.read_only and not self.path.is_file():
+            raise Exception("Fuse history '{}' does not exist".format(self.path))
+
+        # New history files start with a header
+        if not self.read_only and (not self.path.exists() or self.path.stat().st_size == 0):
+            with open(self.path, 'wb') as history_file:
+                history_file.write(header_format.pack(history_magic, history_version, record_format.size))
+
+        with open(self.path, 'rb') as history_file:
+            header = history_file.read(header_format.size)
+
+        magic, version, record_size = header_format.unpack(header) if len(header) == header_format.size else (b'', 0, 0)
+        if magic != history_magic or version != history_version or record_size != record_format.size:
+            raise Exception("'{}' is not a version {} fuse history file".format(self.path, history_version))
+
+        # Controller ids are line numbers of the sidecar file
+        if self.controllers_path.exists():
+            self.controller_ips = self.controllers_path.read_text(encoding='utf-8').splitlines()
+            self.controller_ids = {ip: controller_id for controller_id, ip in enumerate(self.controller_ips)}
+
+        if self.read_only:
+            self.logger.debug("Opened fuse history '%s' read-only", self.path)
+            return
+
+        # Continue from the last recorded state of every fuse
+        with self.__mapped() as (buffer, count):
+            if count:
+                self.last_timestamp = RecordTimestamps(buffer, count)[count - 1]
+            self.last_states = self.__scan_states(buffer, count, count, set(self.controller_ids.values()))
+
+        self.file = open(self.path, 'ab')
+        self.logger.debug("Opened fuse history '%s' (%s controller(s))", self.path, len(self.controller_ips))
+
+    def __controller_id(self, ip):
+        if ip not in self.controller_ids:
+            if len(self.controller_ips) > 0xFFFF:
+                raise Exception("Fuse history '{}' is full (too many controllers)".format(self.path))
+
+            with open(self.controllers_path, 'a', encoding='utf-8') as controllers_file:
+                controllers_file.write(ip + '\n')
+
+            self.controller_ids[ip] = len(self.controller_ips)
+            self.controller_ips.append(ip)
+
+        return self.controller_ids[ip]
+
+    def record(self, ip, fuse_block, timestamp=None):
+        """Appends the fuses of a status query that changed (or a full snapshot when one is due)"""
+        if self.file is None:
+            raise Exception("Fuse history '{}' is not open for recording".format(self.path))
+
+        # Timestamps never go backwards, so the file stays sorted for bisect
+        timestamp = max(time.time() if timestamp is None else timestamp, self.last_timestamp)
+        controller_id = self.__controller_id(ip)
+        snapshot = timestamp - self.last_snapshots.get(controller_id, float('-inf')) >= self.snapshot_interval
+
+        # Most polls change nothing: compare the raw columns before looking at single fuses
+        block_bytes = (fuse_block.port_ids.tobytes() + fuse_block.receivers.tobytes(), fuse_block.states.tobytes())
+        if not snapshot and self.last_blocks.get(controller_id) == block_bytes:
+            return 0
+        self.last_blocks[controller_id] = block_bytes
+
+        records = []
+        for port_id, receiver, state in zip(fuse_block.port_ids, fuse_block.receivers, fuse_block.states):
+            key = (controller_id, port_id + 1, receiver)
+            previous = self.last_states.get(key)
+
+            if previous == state and not snapshot:
+                continue
+
+            flags = (record_changed if previous is not None and previous != state else 0) | \
+                (record_snapshot if snapshot else 0)
+            records.append(record_format.pack(timestamp, controller_id, port_id + 1, receiver, state, flags))
+            self.last_states[key] = state
+
+        if snapshot:
+            self.last_snapshots[controller_id] = timestamp
+
+        if records:
+            self.file.write(b''.join(records))
+            self.file.flush()
+            self.last_timestamp = timestamp
+
+        return len(records)
+
+    @contextlib.contextmanager
+    def __mapped(self):
+        # Map the complete records (a partially written last record is ignored)
+        count = max((self.path.stat().st_size - header_format.size) // record_format.size, 0)
+
+        if count == 0:
+            yield b'', 0
+            return
+
+        with open(self.path, 'rb') as history_file:
+            with mmap.mmap(history_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer, count
+
+    @staticmethod
+    def __records(buffer, start, end, reverse=False):
+        # Decode a chunk at a time, so only one chunk is ever held in memory
+        chunks = range(start, end, scan_chunk_records)
+
+        for chunk_start in (reversed(chunks) if reverse else chunks):
+            chunk_end = min(chunk_start + scan_chunk_records, end)
+            data = buffer[header_format.size + chunk_start * record_format.size:
+                          header_format.size + chunk_end * record_format.size]
+            records = record_format.iter_unpack(data)
+
+            yield from (reversed(list(records)) if reverse else records)
+
+    @staticmethod
+    def __bounds(buffer, count, since, until):
+        timestamps = RecordTimestamps(buffer, count)
+        start = bisect_left(timestamps, since) if since is not None else 0
+        end = bisect_right(timestamps, until) if until is not None else count
+
+        return start, end
+
+    def __controller_filter(self, ip):
+        if ip is None:
+            return set(self.controller_ids.values())
+
+        return {self.controller_ids[ip]} if ip in self.controller_ids else set()
+
+    def trips(self, since=None, until=None, ip=None):
+        """Returns (timestamp, ip, port, receiver) for every trip between the two timestamps"""
+        controller_ids = self.__controller_filter(ip)
+        tripped = ControllerFuseState.TRIPPED.value
+
+        with self.__mapped() as (buffer, count):
+            start, end = self.__bounds(buffer, count, since, until)
+
+            return [(timestamp, self.controller_ips[controller_id], port, receiver)
+                    for timestamp, controller_id, port, receiver, state, flags in self.__records(buffer, start, end)
+                    if state == tripped and flags & record_changed and controller_id in controller_ids]
+
+    def trip_counts(self, since=None, until=None, ip=None):
+        """Returns a Counter of trips per (ip, port, receiver) between the two timestamps"""
+        return Counter((trip_ip, port, receiver) for _, trip_ip, port, receiver in self.trips(since, until, ip))
+
+    def state_at(self, timestamp, ip=None):
+        """Returns {(ip, port, receiver): ControllerFuseState} as last recorded at or before the timestamp"""
+        with self.__mapped() as (buffer, count):
+            _, end = self.__bounds(buffer, count, None, timestamp)
+            states = self.__scan_states(buffer, count, end, self.__controller_filter(ip))
+
+        return {(self.controller_ips[controller_id], port, receiver): fuse_states[state]
+                for (controller_id, port, receiver), state in states.items()}
+
+    def __scan_states(self, buffer, count, end, controller_ids):
+        # Walk back from `end` until a full snapshot of every controller was passed
+        states = {}
+        snapshot_keys = {}
+        pending = set(controller_ids)
+
+        for _, controller_id, port, receiver, state, flags in self.__records(buffer, 0, end, reverse=True):
+            if not pending:
+                break
+
+            if controller_id not in pending:
+                continue
+
+            key = (controller_id, port, receiver)
+
+            # Older than the controller's newest snapshot: nothing left to learn
+            if controller_id in snapshot_keys and (not flags & record_snapshot or key in snapshot_keys[controller_id]):
+                pending.discard(controller_id)
+                continue
+
+            states.setdefault(key, state)
+
+            if flags & record_snapshot:
+                snapshot_keys.setdefault(controller_id, set()).add(key)
+
+        return states
@@ -0,0 +1,76 @@
+# Import libraries
+from datetime import datetime
+from .history import FuseHistory
+from .table import render_table
+import argparse  # argument parsing
+import logging  # Logging
+import time
+import sys
+
+
+def parse_time(value):
+    # Unix timestamps or ISO 8601 dates / times (local time)
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+# Main function
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='pyf16v5-history',
+                                     description='Query a Falcon F16V5 fuse state history file.')
+    parser.add_argument('history', help='Fuse history file (written by pyf16v5 --history)')
+    parser.add_argument('--ip', help='Only show this controller')
+    parser.add_argument('--trips', action='store_true', help='Show the trip count per port over the last --days days')
+    parser.add_argument('--events', action='store_true', help='Show every trip over the last --days days')
+    parser.add_argument('--days', type=float, help='Number of days for --trips / --events', default=7)
+    parser.add_argument('--at', help='Show the fuse states at this time (Unix timestamp or ISO 8601, e.g. '
+                                     '2026-10-01T20:00)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(format='%(asctime)s | %(levelname)s: %(message)s')
+    logger = logging.getLogger('pyF16V5.history')
+
+    try:
+        at = parse_time(args.at) if args.at else None
+    except ValueError:
+        parser.error('argument --at: invalid time: {}'.format(args.at))
+
+    # Queries never create or append to the file
+    try:
+        history = FuseHistory(args.history, logger, read_only=True)
+    except Exception as e:
+        logger.critical('Cannot open fuse history: %s', e)
+        sys.exit(1)
+
+    with history:
+        since = time.time() - args.days * 86400
+
+        if at is not None:
+            states = history.state_at(at, args.ip)
+            print(render_table([{'ip': ip, 'port': port, 'receiver': receiver, 'state': state}
+                                for (ip, port, receiver), state in sorted(states.items())]))
+
+        if args.trips:
+            print(render_table([{'ip': ip, 'port': port, 'receiver': receiver, 'trips': trips}
+                                for (ip, port, receiver), trips
+                                in history.trip_counts(since, ip=args.ip).most_common()]))
+
+        if args.events:
+            print(render_table([{'time': datetime.fromtimestamp(timestamp).isoformat(timespec='seconds'), 'ip': ip,
+                                 'port': port, 'receiver': receiver}
+                                for timestamp, ip, port, receiver in history.trips(since, ip=args.ip)]))
+
+
+def run(argv=None):
+    """Console entry point"""
+    try:
+        main(argv)
+    except KeyboardInterrupt:
+        pass
+
+
+# Initiate main
+if __name__ == "__main__":
+    run()
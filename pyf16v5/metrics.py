@@ -0,0 +1,161 @@
+# Import libraries
+from bisect import bisect_left
+from .controller_classes import ControllerFuseState
+from .async_http import serve_connection
+import threading
+import asyncio
+import json
+import time
+
+
+# Request duration histogram buckets (in seconds)
+duration_buckets_default = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Prometheus text exposition content type
+prometheus_content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def format_labels(labels):
+    # Label values escaped as the Prometheus text format requires
+    return ','.join('{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+                    for key, value in labels)
+
+
+# Class for Controller API Metrics (request counts, durations, timeouts, bytes and fuse state gauges)
+class MetricsRegistry:
+    def __init__(self, buckets=duration_buckets_default) -> None:
+        self.buckets = tuple(buckets)
+        self.started = time.time()
+        self.requests = {}
+        self.durations = {}
+        self.timeouts = {}
+        self.bytes_sent = {}
+        self.bytes_received = {}
+        self.fuse_counts = {}
+
+        # The blocking Controller may record from several threads (see Controller.refresh)
+        self.lock = threading.Lock()
+
+    def observe_request(self, ip, method, status, duration, sent=0, received=0, timed_out=False):
+        """Records one API call (status is the HTTP status code, or 'timeout' / 'error' when none was received)"""
+        with self.lock:
+            key = (ip, method)
+            self.requests[(ip, method, str(status))] = self.requests.get((ip, method, str(status)), 0) + 1
+
+            # Per-bucket counts plus the +Inf bucket, then the sum of all durations
+            histogram = self.durations.get(key)
+            if histogram is None:
+                histogram = self.durations[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            histogram[bisect_left(self.buckets, duration)] += 1
+            histogram[-1] += duration
+
+            if timed_out:
+                self.timeouts[key] = self.timeouts.get(key, 0) + 1
+
+            self.bytes_sent[ip] = self.bytes_sent.get(ip, 0) + sent
+            self.bytes_received[ip] = self.bytes_received.get(ip, 0) + received
+
+    def set_fuse_counts(self, ip, counts):
+        """Sets the fuse count gauges of a controller ({ControllerFuseState: count})"""
+        with self.lock:
+            self.fuse_counts[ip] = {state: counts.get(state, 0) for state in ControllerFuseState}
+
+    def to_dict(self):
+        """Returns every metric as plain JSON-serializable data"""
+        with self.lock:
+            requests = {}
+            for (ip, method, status), count in self.requests.items():
+                requests.setdefault(ip, {}).setdefault(method, {})[status] = count
+
+            durations = {}
+            for (ip, method), histogram in self.durations.items():
+                count = sum(histogram[:-1])
+                durations.setdefault(ip, {})[method] = {
+                    'count': count,
+                    'sum': histogram[-1],
+                    'mean': histogram[-1] / count if count else 0.0,
+                    'buckets': dict(zip([str(bucket) for bucket in self.buckets] + ['+Inf'],
+                                        self.__cumulative(histogram))),
+                    'timeouts': self.timeouts.get((ip, method), 0),
+                }
+
+            return {
+                'timestamp': time.time(),
+                'uptime': time.time() - self.started,
+                'requests': requests,
+                'durations': durations,
+                'bytes_sent': dict(self.bytes_sent),
+                'bytes_received': dict(self.bytes_received),
+                'fuses': {ip: {state.name: count for state, count in counts.items()}
+                          for ip, counts in self.fuse_counts.items()},
+            }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+    @staticmethod
+    def __cumulative(histogram):
+        total = 0
+        counts = []
+
+        for count in histogram[:-1]:
+            total += count
+            counts.append(total)
+
+        return counts
+
+    def to_prometheus(self):
+        """Returns every metric in the Prometheus text exposition format"""
+        with self.lock:
+            lines = ['# HELP f16v5_requests_total Controller API calls by method and HTTP status',
+                     '# TYPE f16v5_requests_total counter']
+            lines.extend('f16v5_requests_total{{{}}} {}'.format(
+                format_labels((('ip', ip), ('method', method), ('status', status))), count)
+                for (ip, method, status), count in sorted(self.requests.items()))
+
+            lines.extend(['# HELP f16v5_request_duration_seconds Controller API call duration',
+                          '# TYPE f16v5_request_duration_seconds histogram'])
+            for (ip, method), histogram in sorted(self.durations.items()):
+                labels = (('ip', ip), ('method', method))
+                cumulative = self.__cumulative(histogram)
+
+                for bucket, count in zip([str(bucket) for bucket in self.buckets] + ['+Inf'], cumulative):
+                    lines.append('f16v5_request_duration_seconds_bucket{{{}}} {}'.format(
+                        format_labels(labels + (('le', bucket),)), count))
+                lines.append('f16v5_request_duration_seconds_sum{{{}}} {}'.format(format_labels(labels), histogram[-1]))
+                lines.append('f16v5_request_duration_seconds_count{{{}}} {}'.format(format_labels(labels),
+                                                                                    cumulative[-1]))
+
+            lines.extend(['# HELP f16v5_request_timeouts_total Controller API calls that timed out',
+                          '# TYPE f16v5_request_timeouts_total counter'])
+            lines.extend('f16v5_request_timeouts_total{{{}}} {}'.format(
+                format_labels((('ip', ip), ('method', method))), count)
+                for (ip, method), count in sorted(self.timeouts.items()))
+
+            for name, description, values in (('sent', 'Request bytes sent', self.bytes_sent),
+                                              ('received', 'Response bytes received', self.bytes_received)):
+                lines.extend(['# HELP f16v5_bytes_{}_total {} per controller'.format(name, description),
+                              '# TYPE f16v5_bytes_{}_total counter'.format(name)])
+                lines.extend('f16v5_bytes_{}_total{{{}}} {}'.format(name, format_labels((('ip', ip),)), count)
+                             for ip, count in sorted(values.items()))
+
+            lines.extend(['# HELP f16v5_fuses Fuses per controller by state',
+                          '# TYPE f16v5_fuses gauge'])
+            for ip, counts in sorted(self.fuse_counts.items()):
+                lines.extend('f16v5_fuses{{{}}} {}'.format(format_labels((('ip', ip), ('state', state.name))), count)
+                             for state, count in counts.items())
+
+            return '\n'.join(lines) + '\n'
+
+
+async def start_metrics_server(metrics, host, port):
+    """Serves the registry in the Prometheus text format at /metrics (and as JSON at /metrics.json)"""
+    async def handle(request):
+        if request.path == '/metrics':
+            return 200, metrics.to_prometheus().encode(), prometheus_content_type
+        if request.path == '/metrics.json':
+            return 200, metrics.to_json().encode()
+
+        return 404, b'', 'text/plain'
+
+    return await asyncio.start_server(serve_connection(handle), host, port)
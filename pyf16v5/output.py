@@ -0,0 +1,99 @@
+# Import libraries
+import json
+import csv
+import sys
+
+
+# Output formats for command results ('table' is the logged status table)
+output_formats = ['table', 'ndjson', 'csv', 'json']
+
+# Fields of every result row: the fuse fields of ControllerFuse.to_dict() plus the controller and timing
+result_fields = ['ip', 'name', 'port', 'receiver', 'state', 'duration', 'error']
+
+
+def result_rows(result, dry_run=False):
+    """Yields one row per fuse of a controller result (one row for failed controllers and bulk commands)"""
+    name = result.controller.name if result.controller else None
+    duration = round(result.duration, 6)
+
+    if not result.ok:
+        yield {'ip': result.ip, 'name': name, 'port': None, 'receiver': None, 'state': 'ERROR', 'duration': duration,
+               'error': str(result.error)}
+        return
+
+    # Bulk commands do not read the fuse state back (and a dry run only planned them)
+    if result.fuses is None:
+        yield {'ip': result.ip, 'name': name, 'port': None, 'receiver': None,
+               'state': 'PLANNED' if dry_run else 'SENT', 'duration': duration, 'error': None}
+        return
+
+    for fuse in sorted(result.fuses, key=lambda x: (x.port_id, x.receiver)):
+        row = fuse.to_dict()
+        yield {'ip': result.ip, 'name': name, 'port': row['port'], 'receiver': row['receiver'],
+               'state': str(row['state']), 'duration': duration, 'error': None}
+
+
+# Class for newline delimited JSON output (one object per fuse)
+class NdjsonWriter:
+    def __init__(self, stream=None, dry_run=False) -> None:
+        self.stream = stream or sys.stdout
+        self.dry_run = dry_run
+
+    def write(self, result):
+        self.stream.write(''.join(json.dumps(row) + '\n' for row in result_rows(result, self.dry_run)))
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+
+# Class for CSV output (header row first, then one row per fuse)
+class CsvWriter:
+    def __init__(self, stream=None, dry_run=False) -> None:
+        self.stream = stream or sys.stdout
+        self.dry_run = dry_run
+        self.writer = csv.DictWriter(self.stream, result_fields, lineterminator='\n')
+        self.writer.writeheader()
+        self.stream.flush()
+
+    def write(self, result):
+        self.writer.writerows(result_rows(result, self.dry_run))
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+
+# Class for JSON array output (elements are written as they arrive, the array is closed at the end)
+class JsonWriter:
+    def __init__(self, stream=None, dry_run=False) -> None:
+        self.stream = stream or sys.stdout
+        self.dry_run = dry_run
+        self.separator = '[\n'
+
+    def write(self, result):
+        for row in result_rows(result, self.dry_run):
+            self.stream.write(self.separator + '  ' + json.dumps(row))
+            self.separator = ',\n'
+
+        self.stream.flush()
+
+    def close(self):
+        # An empty result list is still valid JSON
+        self.stream.write('[]\n' if self.separator == '[\n' else '\n]\n')
+        self.stream.flush()
+
+
+# Writers for the machine-readable output formats
+output_writers = {
+    'ndjson': NdjsonWriter,
+    'csv': CsvWriter,
+    'json': JsonWriter,
+}
+
+
+def create_output_writer(output_format, stream=None, dry_run=False):
+    """Returns the streaming writer for an output format (None for the logged table)"""
+    writer_class = output_writers.get(output_format)
+
+    return writer_class(stream, dry_run) if writer_class is not None else None
@@ -0,0 +1,212 @@
+# Import libraries
+from dataclasses import dataclass, field
+from typing import List
+from .controller_classes import ControllerFuseState, fuse_action_states, fuse_action_required
+import logging
+
+
+# Fuse states each fuse action applies to
+fuse_action_sources = {
+    'on': ControllerFuseState.OFF,
+    'off': ControllerFuseState.GOOD,
+    'reset': ControllerFuseState.TRIPPED,
+}
+
+
+# Class for a single planned controller API call
+@dataclass
+class PlannedCall:
+    action: str
+    bulk: bool
+    fuses: List = None
+
+    def __str__(self):
+        if not self.bulk:
+            return "{} fuse at Port: {}, Receiver: {}".format(self.action, self.fuses[0].port, self.fuses[0].receiver)
+
+        if self.fuses is None:
+            return "{} all fuses (blind bulk request)".format(self.action)
+
+        return "{} all fuses (bulk request covering {} fuse(s))".format(self.action, len(self.fuses))
+
+
+# Class for a command plan (the minimal set of API calls for a command)
+@dataclass
+class CommandPlan:
+    command: str
+    calls: List[PlannedCall] = field(default_factory=list)
+    skipped: List = field(default_factory=list)
+
+    @property
+    def request_count(self):
+        return len(self.calls)
+
+    def describe(self):
+        lines = ["Plan for '{}': {} request(s), {} fuse(s) already in the requested state or not changeable".format(
+            self.command,
+            self.request_count,
+            len(self.skipped))]
+        lines.extend("  {}. {}".format(index, call) for index, call in enumerate(self.calls, 1))
+
+        return '\n'.join(lines)
+
+    async def execute(self, controller):
+        """Runs the planned calls on an AsyncController"""
+        single_fuses = [call.fuses[0] for call in self.calls if not call.bulk]
+
+        for call in self.calls:
+            if call.bulk:
+                await bulk_method(controller, call.action)()
+                update_fuse_states(call)
+
+        if single_fuses:
+            await single_method(controller, self.command, many=True)(single_fuses)
+
+    def execute_sync(self, controller):
+        """Runs the planned calls on a blocking Controller"""
+        for call in self.calls:
+            if call.bulk:
+                bulk_method(controller, call.action)()
+                update_fuse_states(call)
+            else:
+                single_method(controller, call.action)(call.fuses[0])
+
+    def mismatches(self, fuse_block):
+        """Returns the fuses of a freshly read fuse block that did not end up in the command's target state"""
+        expected = fuse_action_states[self.command]
+
+        # Blind bulk calls target whatever the command still applies to
+        if any(call.bulk and call.fuses is None for call in self.calls):
+            return fuse_block.select(fuse_action_sources[self.command])
+
+        targets = [fuse_block.find_fuse_in_block(fuse.port, fuse.receiver)
+                   for call in self.calls for fuse in call.fuses]
+
+        return [fuse for fuse in targets if fuse is not None and fuse.state is not expected]
+
+    async def verify(self, controller, retries=0, logger=None):
+        """Re-reads the fuse details once, reports fuses not in the target state and retries only those"""
+        logger = logger or logging.getLogger(__name__)
+
+        # Nothing was sent, so there is nothing to verify
+        if not self.calls:
+            return []
+
+        for attempt in range(retries + 1):
+            await controller.get_controller_fuses()
+            mismatched = self.__reconcile(controller, attempt == retries, logger)
+
+            if mismatched is None:
+                break
+
+            await plan_command(self.command, mismatched, controller.fuse_block, logger).execute(controller)
+
+        return self.mismatches(controller.fuse_block)
+
+    def verify_sync(self, controller, retries=0, logger=None):
+        """Re-reads the fuse details once on a blocking Controller, reports mismatches and retries only those"""
+        logger = logger or logging.getLogger(__name__)
+
+        # Nothing was sent, so there is nothing to verify
+        if not self.calls:
+            return []
+
+        for attempt in range(retries + 1):
+            controller.refresh(details=False)
+            mismatched = self.__reconcile(controller, attempt == retries, logger)
+
+            if mismatched is None:
+                break
+
+            plan_command(self.command, mismatched, controller.fuse_block, logger).execute_sync(controller)
+
+        return self.mismatches(controller.fuse_block)
+
+    def __reconcile(self, controller, last_attempt, logger):
+        # Returns the fuses to retry, or None once everything matches (or no retries are left)
+        mismatched = self.mismatches(controller.fuse_block)
+
+        for fuse in mismatched:
+            logger.warning("Fuse at Port: %s, Receiver: %s on '%s' is %s after '%s' (expected %s)",
+                           fuse.port,
+                           fuse.receiver,
+                           controller.ip,
+                           fuse.state,
+                           self.command,
+                           fuse_action_states[self.command])
+
+        if not mismatched or last_attempt:
+            return None
+
+        logger.info("Retrying '%s' on %s mismatched fuse(s) on '%s'", self.command, len(mismatched), controller.ip)
+
+        return mismatched
+
+
+def bulk_method(controller, action):
+    return {
+        'on': controller.turn_on_all_fuses,
+        'off': controller.turn_off_all_fuses,
+        'reset': controller.reset_all_fuses,
+    }[action]
+
+
+def single_method(controller, action, many=False):
+    if many:
+        return {
+            'on': controller.turn_on_fuses,
+            'off': controller.turn_off_fuses,
+            'reset': controller.reset_fuses,
+        }[action]
+
+    return {
+        'on': controller.turn_on_fuse,
+        'off': controller.turn_off_fuse,
+        'reset': controller.reset_fuse,
+    }[action]
+
+
+def update_fuse_states(call):
+    # Blind bulk calls have no local fuses to update
+    for fuse in call.fuses or []:
+        fuse.set_state(fuse_action_states[call.action])
+
+
+def plan_command(command, selected_fuses=None, fuse_block=None, logger=None):
+    """Plans the fewest API calls that bring the selected fuses (default: all) to the command's target state"""
+    logger = logger or logging.getLogger(__name__)
+    plan = CommandPlan(command)
+
+    if command not in fuse_action_states:
+        return plan
+
+    # Without fuse details only a blind bulk request can be planned
+    if fuse_block is None:
+        if selected_fuses is not None:
+            raise ValueError("Fuse details are required to plan '{}' on selected fuses".format(command))
+
+        plan.calls.append(PlannedCall(command, True))
+        return plan
+
+    if selected_fuses is None:
+        selected_fuses = fuse_block.fuses
+
+    # Skip fuses the command would not change
+    changes = []
+    for fuse in selected_fuses:
+        if fuse_action_required(fuse, command, logger):
+            changes.append(fuse)
+        else:
+            plan.skipped.append(fuse)
+
+    # A bulk request is only safe when it would change exactly the selected fuses
+    block_changes = {(fuse.port_id, fuse.receiver) for fuse in fuse_block.select(fuse_action_sources[command])}
+    block_unknown = fuse_block.count_by_state()[ControllerFuseState.UNKNOWN] > 0
+
+    if len(changes) > 1 and not block_unknown and \
+            block_changes == {(fuse.port_id, fuse.receiver) for fuse in changes}:
+        plan.calls.append(PlannedCall(command, True, changes))
+    else:
+        plan.calls.extend(PlannedCall(command, False, [fuse]) for fuse in changes)
+
+    return plan
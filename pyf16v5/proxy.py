@@ -0,0 +1,190 @@
+# Import libraries
+from .controller_classes import AsyncController, pool_size_default
+from .async_http import serve_connection
+from .fleet import parse_targets
+from .transport import json_dumps
+import argparse  # argument parsing
+import asyncio  # async io
+import logging  # Logging
+import json
+import time
+
+# Default cache lifetime for controller details and fuse details (in seconds)
+ttl_default = 1.0
+
+# Default proxy listen address
+listen_default = '127.0.0.1:8016'
+
+# Query methods answered from the cache (everything else is a write)
+cached_methods = ('ST', 'CQ')
+
+
+# Class for a Caching Proxy in front of one or more controllers
+class CachingProxy:
+    def __init__(self, logger, ttl=ttl_default, request_timeout=3, connect_timeout=None, pool_size=pool_size_default,
+                 allowed_ips=None, refresh_after_write=False) -> None:
+        self.logger = logger
+        self.ttl = ttl
+        self.request_timeout = request_timeout
+        self.connect_timeout = connect_timeout
+        self.pool_size = pool_size
+        self.allowed_ips = set(allowed_ips) if allowed_ips is not None else None
+        self.refresh_after_write = refresh_after_write
+        self.controllers = {}
+        self.cache = {}
+        self.in_flight = {}
+        self.generations = {}
+        self.write_locks = {}
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'writes': 0, 'errors': 0}
+
+    def controller(self, ip):
+        """Returns the (pooled) controller client for an address"""
+        if ip not in self.controllers:
+            self.controllers[ip] = AsyncController(ip, self.logger, self.request_timeout, self.connect_timeout,
+                                                   self.pool_size)
+            self.write_locks[ip] = asyncio.Lock()
+            self.generations[ip] = 0
+
+        return self.controllers[ip]
+
+    async def query(self, ip, method):
+        """Answers a query from the cache, joining an identical upstream request already in flight"""
+        key = (ip, method)
+        entry = self.cache.get(key)
+
+        if entry is not None and entry[0] > time.monotonic():
+            self.stats['hits'] += 1
+            return entry[1]
+
+        fetch = self.in_flight.get(key)
+
+        if fetch is None:
+            self.stats['misses'] += 1
+            fetch = asyncio.ensure_future(self.__fetch(ip, method))
+            self.in_flight[key] = fetch
+            fetch.add_done_callback(lambda done: self.__fetch_done(key, done))
+        else:
+            self.stats['coalesced'] += 1
+
+        # Shielded, so one cancelled client does not cancel the request for the others
+        return await asyncio.shield(fetch)
+
+    def __fetch_done(self, key, fetch):
+        # A write may already have replaced the request in flight with a newer one
+        if self.in_flight.get(key) is fetch:
+            del self.in_flight[key]
+
+    async def __fetch(self, ip, method):
+        controller = self.controller(ip)
+        generation = self.generations[ip]
+
+        response_json = await controller.send(method, {}, "Q", "Error querying controller")
+        body = json_dumps(response_json)
+
+        # Responses that raced a write are returned but not cached
+        if self.generations[ip] == generation:
+            self.cache[(ip, method)] = (time.monotonic() + self.ttl, body)
+
+        return body
+
+    async def write(self, ip, method, params, message_type):
+        """Sends a write command (one at a time per controller) and invalidates the cached fuse details"""
+        controller = self.controller(ip)
+
+        async with self.write_locks[ip]:
+            self.stats['writes'] += 1
+
+            try:
+                response_json = await controller.send(method, params, message_type, "Error sending command")
+            finally:
+                self.generations[ip] += 1
+                self.cache.pop((ip, 'CQ'), None)
+
+                # Readers arriving after the write must not join a fuse query sent before it
+                self.in_flight.pop((ip, 'CQ'), None)
+
+        # Optionally warm the cache again for the readers that follow the write
+        if self.refresh_after_write:
+            asyncio.ensure_future(self.query(ip, 'CQ')).add_done_callback(lambda task: task.exception())
+
+        return json_dumps(response_json)
+
+    async def handle(self, request):
+        """Returns (status, body) for one proxied request ('/<controller ip>/api' or '/stats')"""
+        if request.path == '/stats':
+            return 200, json.dumps(self.stats).encode()
+
+        parts = request.path.strip('/').split('/')
+        if request.method != 'POST' or len(parts) != 2 or parts[1] != 'api':
+            return 404, json.dumps({'error': 'Unknown path: {}'.format(request.path)}).encode()
+
+        ip = parts[0]
+        if self.allowed_ips is not None and ip not in self.allowed_ips:
+            return 403, json.dumps({'error': "Controller '{}' is not allowed".format(ip)}).encode()
+
+        try:
+            request_json = request.json()
+            method = request_json.get("M")
+
+            if method in cached_methods:
+                return 200, await self.query(ip, method)
+
+            return 200, await self.write(ip, method, request_json.get("P", {}), request_json.get("T", "S"))
+        except ValueError as e:
+            return 400, json.dumps({'error': 'Invalid request: {}'.format(e)}).encode()
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.warning("Request to controller at '%s' failed: %s", ip, e)
+            return 502, json.dumps({'error': str(e)}).encode()
+
+    async def start(self, host, port):
+        """Starts listening and returns the asyncio server"""
+        return await asyncio.start_server(serve_connection(self.handle), host, port)
+
+    async def close(self):
+        for controller in self.controllers.values():
+            await controller.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Caching proxy in front of Falcon F16V5 Pixel Controllers.')
+    parser.add_argument('--listen', help='Address to listen on (host:port)', default=listen_default)
+    parser.add_argument('--ttl', type=float, help='Cache lifetime for controller and fuse details (in seconds)',
+                        default=ttl_default)
+    parser.add_argument('--timeout', type=int, help='Timeout for controller requests (in seconds)', default=3)
+    parser.add_argument('--controllers', help='Only proxy these controller addresses, ranges or CIDR blocks')
+    parser.add_argument('--refresh-after-write', action='store_true',
+                        help='Re-query the fuse details right after every write command')
+    parser.add_argument('--debug', type=bool, help='Verbose mode for debugging', nargs='?', const=True)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
+                        format='%(asctime)s | %(levelname)s: %(message)s')
+    logger = logging.getLogger('pyF16V5.proxy')
+
+    allowed_ips = parse_targets(args.controllers) if args.controllers else None
+    proxy = CachingProxy(logger, args.ttl, args.timeout, allowed_ips=allowed_ips,
+                         refresh_after_write=args.refresh_after_write)
+
+    host, _, port = args.listen.rpartition(':')
+    server = await proxy.start(host, int(port))
+    logger.info("Proxy listening on http://%s/<controller ip>/api", args.listen)
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await proxy.close()
+
+
+def run():
+    """Console entry point"""
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+# Initiate main
+if __name__ == "__main__":
+    run()
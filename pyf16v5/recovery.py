@@ -0,0 +1,147 @@
+# Import libraries
+from collections import deque
+from .controller_classes import ControllerFuseState
+import asyncio
+import time
+
+
+# Default auto-recovery limits
+reset_limit_default = 10  # fuse resets per controller per window
+reset_window_default = 60.0  # seconds
+
+
+# Class for the recovery history of one fuse
+class FuseRecoveryState:
+    __slots__ = ('attempts', 'next_attempt', 'resets', 'quarantined', 'good_since')
+
+    def __init__(self) -> None:
+        self.attempts = 0
+        self.next_attempt = 0.0
+        self.resets = deque()
+        self.quarantined = False
+        self.good_since = None
+
+
+# Class for Automatic Tripped-Fuse Recovery
+class AutoRecovery:
+    def __init__(self, logger, base_delay=5.0, max_delay=300.0, reset_limit=reset_limit_default,
+                 reset_window=reset_window_default, quarantine_after=3, quarantine_window=600.0, stable_after=60.0,
+                 clock=time.monotonic) -> None:
+        self.logger = logger
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.reset_limit = reset_limit
+        self.reset_window = reset_window
+        self.quarantine_after = quarantine_after
+        self.quarantine_window = quarantine_window
+        self.stable_after = stable_after
+        self.clock = clock
+        self.fuse_states = {}
+        self.controller_resets = {}
+
+    def quarantined(self):
+        """Returns the (ip, port, receiver) of every quarantined fuse"""
+        return [key for key, state in self.fuse_states.items() if state.quarantined]
+
+    def release(self, ip, port, receiver):
+        """Lifts the quarantine (and backoff) of a fuse"""
+        self.fuse_states.pop((ip, port, receiver), None)
+
+    def __fuse_state(self, key):
+        if key not in self.fuse_states:
+            self.fuse_states[key] = FuseRecoveryState()
+
+        return self.fuse_states[key]
+
+    def __forget_stable_fuses(self, controller, now):
+        # Fuses that stayed good long enough start over with the base backoff
+        for key, state in self.fuse_states.items():
+            if key[0] != controller.ip or state.quarantined or not state.attempts:
+                continue
+
+            fuse = controller.fuse_block.find_fuse_in_block(key[1], key[2])
+
+            if fuse is None or fuse.state is ControllerFuseState.TRIPPED:
+                state.good_since = None
+            elif state.good_since is None:
+                state.good_since = now
+            elif now - state.good_since >= self.stable_after:
+                state.attempts = 0
+
+    def eligible_fuses(self, controller, now=None, fuses=None):
+        """Returns the tripped fuses of the controller that may be reset now (limited to the (port, receiver) fuses)"""
+        now = self.clock() if now is None else now
+        self.__forget_stable_fuses(controller, now)
+
+        eligible = []
+        for fuse in controller.fuse_block.select(ControllerFuseState.TRIPPED):
+            # Fuses outside the selection are never reset
+            if fuses is not None and (fuse.port, fuse.receiver) not in fuses:
+                continue
+
+            state = self.__fuse_state((controller.ip, fuse.port, fuse.receiver))
+
+            # Drop resets that left the quarantine window
+            while state.resets and now - state.resets[0] > self.quarantine_window:
+                state.resets.popleft()
+
+            if not state.quarantined and len(state.resets) >= self.quarantine_after:
+                state.quarantined = True
+                self.logger.warning("Fuse at Port: %s, Receiver: %s on '%s' keeps tripping: quarantined after %s "
+                                    "resets", fuse.port, fuse.receiver, controller.ip, len(state.resets))
+
+            if not state.quarantined and now >= state.next_attempt:
+                eligible.append(fuse)
+
+        # Cap the number of resets per controller per window
+        resets = self.controller_resets.setdefault(controller.ip, deque())
+        while resets and now - resets[0] > self.reset_window:
+            resets.popleft()
+
+        remaining = max(self.reset_limit - len(resets), 0)
+        if len(eligible) > remaining:
+            self.logger.warning("Reset limit reached on '%s': deferring %s tripped fuse(s)",
+                                controller.ip,
+                                len(eligible) - remaining)
+
+        return eligible[:remaining]
+
+    async def recover(self, controller, selected=None):
+        """Resets the eligible tripped fuses of an AsyncController (after its fuse details were refreshed)"""
+        now = self.clock()
+        fuses = self.eligible_fuses(controller, now, selected)
+
+        if not fuses:
+            return []
+
+        tripped = controller.fuse_block.select_rows(ControllerFuseState.TRIPPED)
+
+        self.logger.warning("Auto-resetting %s tripped fuse(s) on '%s': %s",
+                            len(fuses),
+                            controller.ip,
+                            ', '.join('{}:{}'.format(fuse.port, fuse.receiver) for fuse in fuses))
+
+        # Record the attempt first so failed resets back off too
+        self.__record_resets(controller.ip, fuses, now)
+
+        # One bulk reset only when every tripped fuse on the controller is eligible (none outside the selection),
+        # otherwise reset only the eligible ones. The fuses stay tripped locally, so the next poll reports (and
+        # records) whether the reset actually recovered them
+        if len(fuses) > 1 and len(fuses) == len(tripped):
+            await controller.send("FR", {}, "S", "Error resetting controller fuses")
+        else:
+            await asyncio.gather(*(controller.send("FR", {"P": fuse.port_id, "R": fuse.receiver}, "S",
+                                                   "Error resetting controller fuse") for fuse in fuses))
+
+        return fuses
+
+    def __record_resets(self, ip, fuses, now):
+        self.controller_resets.setdefault(ip, deque()).extend([now] * len(fuses))
+
+        # Back off exponentially per fuse
+        for fuse in fuses:
+            state = self.__fuse_state((ip, fuse.port, fuse.receiver))
+            state.attempts += 1
+            state.resets.append(now)
+            state.good_since = None
+            state.next_attempt = now + min(self.base_delay * 2 ** (state.attempts - 1), self.max_delay)
@@ -0,0 +1,130 @@
+# Import libraries
+from dataclasses import dataclass, field
+from typing import List
+from .controller_classes import fuse_action_required
+import asyncio
+import logging
+import time
+
+
+# Default staging (fuses switched on per supply at once, and the settle time between waves in seconds)
+wave_size_default = 4
+wave_delay_default = 0.5
+
+
+# Class for one wave of fuses switched on together on one supply
+@dataclass
+class PowerUpWave:
+    supply: str
+    index: int
+    fuses: List = field(default_factory=list)  # (controller, fuse)
+
+    def __str__(self):
+        return "Supply '{}' wave {}: {}".format(
+            self.supply,
+            self.index + 1,
+            ', '.join("{} {}:{}".format(controller.ip, fuse.port, fuse.receiver) for controller, fuse in self.fuses))
+
+
+def parse_ports(port_string):
+    # Port lists and ranges (e.g. 1-8,12)
+    ports = set()
+
+    for part in port_string.split(','):
+        start, _, end = part.strip().partition('-')
+        ports.update(range(int(start), int(end or start) + 1))
+
+    return ports
+
+
+def load_supply_map(supply_map_path):
+    """Reads 'supply = ip:ports[; ip:ports]' lines (e.g. PSU1 = 10.0.0.5:1-16) into {(ip, port): supply}"""
+    supply_map = {}
+
+    with open(supply_map_path, encoding='utf-8') as supply_map_file:
+        for line in supply_map_file:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+
+            supply, _, targets = line.partition('=')
+            if not targets:
+                raise ValueError("Invalid supply map line: {}".format(line))
+
+            for target in targets.split(';'):
+                ip, _, ports = target.strip().rpartition(':')
+                for port in parse_ports(ports):
+                    supply_map[(ip, port)] = supply.strip()
+
+    return supply_map
+
+
+def plan_power_up(controller_fuses, wave_size=wave_size_default, supply_map=None, logger=None):
+    """Splits the fuses to switch on ({controller: fuses}) into waves of at most wave_size fuses per supply"""
+    logger = logger or logging.getLogger(__name__)
+    supply_map = supply_map or {}
+    supplies = {}
+
+    for controller, fuses in controller_fuses.items():
+        for fuse in fuses:
+            # Fuses that are on, tripped or unknown are left alone
+            if not fuse_action_required(fuse, 'on', logger):
+                continue
+
+            # Fuses without a mapped supply share one supply per controller
+            supply = supply_map.get((controller.ip, fuse.port), controller.ip)
+            supplies.setdefault(supply, []).append((controller, fuse))
+
+    return {supply: [PowerUpWave(supply, index, fuses[start:start + wave_size])
+                     for index, start in enumerate(range(0, len(fuses), wave_size))]
+            for supply, fuses in supplies.items()}
+
+
+async def run_waves(waves, wave_delay, logger):
+    # Waves of one supply run one after the other, with the settle time in between
+    for wave in waves:
+        if wave.index:
+            await asyncio.sleep(wave_delay)
+
+        logger.info('%s', wave)
+
+        # The fuses of a wave are switched on concurrently, grouped by controller
+        by_controller = {}
+        for controller, fuse in wave.fuses:
+            by_controller.setdefault(controller, []).append(fuse)
+
+        try:
+            await asyncio.gather(*(controller.turn_on_fuses(fuses) for controller, fuses in by_controller.items()))
+        except Exception as e:
+            # Stop bringing up a supply once one of its waves failed
+            logger.error("Power-up of supply '%s' stopped at wave %s: %s", wave.supply, wave.index + 1, e)
+            return False
+
+    return True
+
+
+async def run_power_up(schedule, wave_delay=wave_delay_default, logger=None):
+    """Runs a power-up schedule (see plan_power_up) and returns the supplies that failed"""
+    logger = logger or logging.getLogger(__name__)
+    start = time.perf_counter()
+
+    # Supplies in parallel, the waves of each supply in sequence
+    completed = await asyncio.gather(*(run_waves(waves, wave_delay, logger) for waves in schedule.values()))
+
+    logger.info('Power-up of %s fuse(s) on %s supply group(s) finished in %.2fs',
+                sum(len(wave.fuses) for waves in schedule.values() for wave in waves),
+                len(schedule),
+                time.perf_counter() - start)
+
+    return [supply for supply, ok in zip(schedule, completed) if not ok]
+
+
+def describe_power_up(schedule, wave_delay=wave_delay_default):
+    """Returns the power-up schedule as text (with the minimum bring-up time the delays allow)"""
+    lines = ["Power-up plan: {} supply group(s), {} wave(s), at least {:.2f}s".format(
+        len(schedule),
+        sum(len(waves) for waves in schedule.values()),
+        max((len(waves) - 1) * wave_delay for waves in schedule.values()) if schedule else 0.0)]
+    lines.extend("  {}".format(wave) for waves in schedule.values() for wave in waves)
+
+    return '\n'.join(lines)
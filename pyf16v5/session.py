@@ -0,0 +1,149 @@
+# Import libraries
+from dataclasses import dataclass
+import threading
+import asyncio
+import time
+import re
+
+
+# Default age (in seconds) up to which kept fuse details are reused instead of re-read before a command
+fuse_max_age_default = 2.0
+
+# Valid port lists ('all' or port:receiver pairs)
+port_list_pattern = re.compile(r"^all|([1-9]|[12][0-9]|[3][0-2]):[0-9]([,]([1-9]|[12][0-9]|[3][0-2]):[0-9])*$")
+
+# Session steps (fuse commands take an optional port list, wait takes seconds)
+step_commands = ['on', 'off', 'reset', 'status', 'refresh', 'wait']
+
+session_help = '''Commands:
+  on|off|reset [PORTS]   Run a fuse command (PORTS: all or port:receiver pairs like 1:0,2:0; default all)
+  status [PORTS]         Re-read and show the fuse states
+  refresh                Re-read the fuse details of every controller
+  wait SECONDS           Pause before the next command
+  help                   Show this help
+  quit                   End the session'''
+
+
+# Class for one session step (a command line like 'off 1:0,2:0')
+@dataclass
+class SessionStep:
+    command: str
+    ports: str = 'all'
+    seconds: float = 0.0
+    line: int = 0
+
+    def __str__(self):
+        if self.command == 'wait':
+            return 'wait {:g}'.format(self.seconds)
+
+        if self.command == 'refresh':
+            return self.command
+
+        return '{} {}'.format(self.command, self.ports)
+
+
+def parse_step(text, line=0):
+    """Parses a session command line (None for blank lines and comments)"""
+    words = text.split('#', 1)[0].split()
+    if not words:
+        return None
+
+    command = words[0].lower()
+    if command not in step_commands or len(words) > 2:
+        raise ValueError("Invalid session command: {}".format(text.strip()))
+
+    if command == 'wait':
+        if len(words) != 2:
+            raise ValueError("wait needs the number of seconds: {}".format(text.strip()))
+
+        return SessionStep(command, seconds=float(words[1]), line=line)
+
+    ports = words[1] if len(words) == 2 else 'all'
+    if command == 'refresh' and len(words) == 2 or not port_list_pattern.match(ports):
+        raise ValueError("Invalid port list: {}".format(text.strip()))
+
+    return SessionStep(command, ports, line=line)
+
+
+def load_script(script_path):
+    """Reads and checks every step of a script file before any of them runs"""
+    steps = []
+
+    with open(script_path, encoding='utf-8') as script_file:
+        for line_number, text in enumerate(script_file, 1):
+            try:
+                step = parse_step(text, line_number)
+            except ValueError as e:
+                raise ValueError("{} line {}: {}".format(script_path, line_number, e))
+
+            if step is not None:
+                steps.append(step)
+
+    return steps
+
+
+async def read_lines(prompt):
+    """Yields the lines typed at the prompt until end of input (a daemon thread reads stdin)"""
+    loop = asyncio.get_running_loop()
+    lines = asyncio.Queue()
+
+    def read_stdin():
+        while True:
+            try:
+                text = input(prompt)
+            except (EOFError, OSError):
+                text = None
+
+            loop.call_soon_threadsafe(lines.put_nowait, text)
+
+            if text is None:
+                return
+
+            # Wait for the command to finish before showing the next prompt
+            ready.wait()
+            ready.clear()
+
+    ready = threading.Event()
+    threading.Thread(target=read_stdin, daemon=True).start()
+
+    while True:
+        text = await lines.get()
+        if text is None:
+            return
+
+        yield text
+        ready.set()
+
+
+# Class for a Controller Session (controllers, pooled connections and fuse details kept between commands)
+class ControllerSession:
+    def __init__(self, controllers, logger, fuse_max_age=fuse_max_age_default) -> None:
+        self.controllers = list(controllers)
+        self.logger = logger
+        self.fuse_max_age = fuse_max_age
+        self.stale = set()  # controllers whose fuse states are unknown after a blind bulk command
+
+    async def close(self):
+        """Closes the pooled connections of every controller"""
+        for controller in self.controllers:
+            await controller.close()
+
+    def fresh(self, controller):
+        """Checks whether the kept fuse details are recent enough to plan a command on"""
+        return controller.fuse_block is not None and controller.ip not in self.stale and \
+            time.monotonic() - controller.fuses_read_at <= self.fuse_max_age
+
+    async def prepare(self, controller, step):
+        """Re-reads the fuse details a step needs, unless the kept ones are recent enough"""
+        needs_fuses = step.ports != 'all' or step.command in ('status', 'refresh')
+
+        if step.command in ('status', 'refresh') or needs_fuses and not self.fresh(controller):
+            await controller.get_controller_fuses()
+            self.stale.discard(controller.ip)
+
+    def completed(self, controller, fuses):
+        """Tracks the fuse details after a command (blind bulk commands leave them unknown)"""
+        if fuses is None:
+            self.stale.add(controller.ip)
+        else:
+            self.stale.discard(controller.ip)
@@ -0,0 +1,225 @@
+# Import libraries
+from .controller_classes import ControllerFuseState
+from .async_http import serve_connection
+import argparse  # argument parsing
+import asyncio  # async io
+import logging  # Logging
+import random
+import json
+import math
+import time
+
+# Default simulator settings
+layout_default = '16x1'
+host_default = '127.0.0.1'
+base_port_default = 8100
+
+
+def parse_layout(layout):
+    """Returns the receiver count of every port for 'PORTSxRECEIVERS' (e.g. 16x2) or a list of counts (e.g. 4,4,1)"""
+    if 'x' in layout:
+        port_count, receiver_count = (int(value) for value in layout.split('x', 1))
+        receivers = [receiver_count] * port_count
+    else:
+        receivers = [int(value) for value in layout.split(',')]
+
+    if not receivers or min(receivers) < 1:
+        raise ValueError("Invalid port layout: {}".format(layout))
+
+    return receivers
+
+
+# Class for a Simulated F16V5 Controller (speaks the /api JSON protocol)
+class SimulatedController:
+    def __init__(self, logger, name='Simulated F16V5', version='2.01', layout=layout_default, latency=0.0, jitter=0.0,
+                 error_rate=0.0, trip_rate=0.0, retrip_rate=0.0, seed=None, clock=time.monotonic) -> None:
+        self.logger = logger
+        self.name = name
+        self.version = version
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.trip_rate = trip_rate
+        self.retrip_rate = retrip_rate
+        self.random = random.Random(seed)
+        self.clock = clock
+        self.last_trip_check = clock()
+        self.request_count = 0
+
+        # Fuse states by (port id, receiver), every fuse on
+        self.fuses = {(port_id, receiver): ControllerFuseState.GOOD.value
+                      for port_id, receiver_count in enumerate(parse_layout(layout))
+                      for receiver in range(receiver_count)}
+
+    def __trip_random_fuses(self):
+        # Trips arrive at trip_rate per second per controller, applied lazily on each request
+        now = self.clock()
+        elapsed, self.last_trip_check = now - self.last_trip_check, now
+
+        if self.trip_rate <= 0 or self.random.random() >= 1 - math.exp(-self.trip_rate * elapsed):
+            return
+
+        good_fuses = [key for key, state in self.fuses.items() if state == ControllerFuseState.GOOD.value]
+        if good_fuses:
+            key = self.random.choice(good_fuses)
+            self.fuses[key] = ControllerFuseState.TRIPPED.value
+            self.logger.info("Simulated trip on '%s' at Port: %s, Receiver: %s", self.name, key[0] + 1, key[1])
+
+    def __set_fuses(self, params, source_states, state):
+        # A single fuse when a port is given, otherwise every fuse
+        if "P" in params:
+            keys = [(params.get("P"), params.get("R", 0))]
+
+            if keys[0] not in self.fuses:
+                raise KeyError("Unknown fuse at Port: {}, Receiver: {}".format(keys[0][0] + 1, keys[0][1]))
+        else:
+            keys = list(self.fuses)
+
+        for key in keys:
+            if self.fuses[key] in source_states:
+                self.fuses[key] = state
+
+    def apply(self, method, params):
+        """Runs one API method and returns the response parameters"""
+        good = ControllerFuseState.GOOD.value
+        off = ControllerFuseState.OFF.value
+        tripped = ControllerFuseState.TRIPPED.value
+
+        if method == "ST":
+            return {"N": self.name, "V": self.version}
+
+        if method == "CQ":
+            return {"A": [{"p": port_id, "r": receiver, "f": state}
+                          for (port_id, receiver), state in sorted(self.fuses.items())]}
+
+        if method == "TF":
+            key = (params.get("P"), params.get("R", 0))
+            if key not in self.fuses:
+                raise KeyError("Unknown fuse at Port: {}, Receiver: {}".format(key[0] + 1, key[1]))
+
+            self.fuses[key] = off if self.fuses[key] == good else good
+            return {}
+
+        if method == "FT":
+            if params.get("T"):
+                self.__set_fuses({}, (off,), good)
+            else:
+                self.__set_fuses({}, (good,), off)
+            return {}
+
+        if method == "FR":
+            reset_keys = [key for key, state in self.fuses.items() if state == tripped]
+            self.__set_fuses(params, (tripped,), good)
+
+            # Some faults trip the fuse again right after a reset
+            for key in reset_keys:
+                if self.fuses[key] == good and self.random.random() < self.retrip_rate:
+                    self.fuses[key] = tripped
+            return {}
+
+        raise ValueError("Unknown method: {}".format(method))
+
+    async def handle(self, request):
+        """Returns (status, body) for one API request"""
+        self.request_count += 1
+
+        # Injected latency
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self.random.uniform(0, self.jitter))
+
+        self.__trip_random_fuses()
+
+        if request.method != 'POST' or request.path != '/api':
+            return 404, json.dumps({"translationKey": "NOT_FOUND", "error": request.path}).encode()
+
+        # Injected errors
+        if self.error_rate and self.random.random() < self.error_rate:
+            return 500, json.dumps({"translationKey": "SIMULATED_ERROR", "error": "Simulated failure"}).encode()
+
+        try:
+            request_json = request.json()
+            method = request_json.get("M")
+            response_params = self.apply(method, request_json.get("P") or {})
+        except (ValueError, KeyError) as e:
+            return 400, json.dumps({"translationKey": "BAD_REQUEST", "error": str(e)}).encode()
+
+        self.logger.debug("'%s' answered %s", self.name, method)
+
+        return 200, json.dumps({"B": 0, "E": 0, "I": 0, "M": method, "P": response_params, "T": "R"}).encode()
+
+
+async def start_simulators(logger, count=1, host=host_default, base_port=base_port_default, seed=None,
+                           **controller_options):
+    """Starts `count` simulated controllers on consecutive ports (any free port for base_port 0)"""
+    simulators = []
+
+    for index in range(count):
+        controller = SimulatedController(logger,
+                                         name='Simulated F16V5 {}'.format(index + 1),
+                                         seed=None if seed is None else seed + index,
+                                         **controller_options)
+        server = await asyncio.start_server(serve_connection(controller.handle), host,
+                                            base_port + index if base_port else 0)
+        port = server.sockets[0].getsockname()[1]
+        simulators.append(('{}:{}'.format(host, port), controller, server))
+
+    # (address, simulated controller, server) per controller
+    return simulators
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Simulated Falcon F16V5 Pixel Controllers for offline testing.')
+    parser.add_argument('--count', type=int, help='Number of controllers to simulate', default=1)
+    parser.add_argument('--host', help='Address to listen on', default=host_default)
+    parser.add_argument('--base-port', type=int, help='Port of the first controller (one port per controller)',
+                        default=base_port_default)
+    parser.add_argument('--layout', help='Fuse layout as PORTSxRECEIVERS (example: 16x2) or receivers per port '
+                                         '(example: 4,4,1,1)', default=layout_default)
+    parser.add_argument('--latency', type=float, help='Added response latency (in seconds)', default=0.0)
+    parser.add_argument('--jitter', type=float, help='Random extra latency of up to this (in seconds)', default=0.0)
+    parser.add_argument('--error-rate', type=float, help='Fraction of requests answered with an error', default=0.0)
+    parser.add_argument('--trip-rate', type=float, help='Random fuse trips per second per controller', default=0.0)
+    parser.add_argument('--retrip-rate', type=float, help='Fraction of reset fuses that trip again right away',
+                        default=0.0)
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible runs')
+    parser.add_argument('--inventory', help='Write the controller addresses to this inventory file')
+    parser.add_argument('--debug', type=bool, help='Verbose mode for debugging', nargs='?', const=True)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
+                        format='%(asctime)s | %(levelname)s: %(message)s')
+    logger = logging.getLogger('pyF16V5.simulator')
+
+    simulators = await start_simulators(logger, args.count, args.host, args.base_port, args.seed,
+                                        layout=args.layout,
+                                        latency=args.latency,
+                                        jitter=args.jitter,
+                                        error_rate=args.error_rate,
+                                        trip_rate=args.trip_rate,
+                                        retrip_rate=args.retrip_rate)
+    addresses = [address for address, _, _ in simulators]
+
+    if args.inventory:
+        with open(args.inventory, 'w', encoding='utf-8') as inventory_file:
+            inventory_file.write('\n'.join(addresses) + '\n')
+
+    logger.info("Simulating %s controller(s) on %s to %s", len(addresses), addresses[0], addresses[-1])
+
+    try:
+        await asyncio.gather(*(server.serve_forever() for _, _, server in simulators))
+    finally:
+        for _, _, server in simulators:
+            server.close()
+
+
+def run():
+    """Console entry point"""
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+# Initiate main
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,233 @@
+# Import libraries
+from .controller_classes import ControllerFuseState, fuse_states
+import time
+
+# NumPy is optional and only needed for the fleet state table
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Initial number of rows allocated (the columns double in size when full)
+capacity_default = 1024
+
+# State codes as categories for pandas / Arrow exports (codes offset by one, so UNKNOWN (-1) maps to 0)
+state_names = [fuse_states[value].name for value in sorted(fuse_states)]
+state_code_offset = -min(fuse_states)
+
+# Columns of the table
+column_names = ('controller', 'port', 'receiver', 'state', 'changed_at')
+
+
+def column_matches(column, values):
+    # A single value compares directly, which is faster than a set membership test
+    if len(values) == 1:
+        return column == values[0]
+
+    return numpy.isin(column, values)
+
+
+# Class for a Fleet-Wide Fuse State Table (one set of NumPy columns shared by every controller)
+class FleetStateTable:
+    def __init__(self, logger, capacity=capacity_default, clock=time.time) -> None:
+        if numpy is None:
+            raise ImportError("numpy is required for FleetStateTable (pip install numpy)")
+
+        self.logger = logger
+        self.clock = clock
+        self.size = 0
+        self.controller_ids = {}
+        self.controller_ips = []
+        self.ranges = {}  # controller id: (first row, row count)
+
+        # Columns (only the first `size` rows are valid)
+        self.controller = numpy.zeros(capacity, dtype=numpy.uint16)
+        self.port = numpy.zeros(capacity, dtype=numpy.uint16)
+        self.receiver = numpy.zeros(capacity, dtype=numpy.uint16)
+        self.state = numpy.zeros(capacity, dtype=numpy.int8)
+        self.changed_at = numpy.zeros(capacity, dtype=numpy.float64)
+
+    def __len__(self):
+        return self.size
+
+    def __reserve(self, rows):
+        # Grow every column (doubling) so appends stay amortised O(1)
+        capacity = len(self.state)
+        if self.size + rows <= capacity:
+            return
+
+        while capacity < self.size + rows:
+            capacity *= 2
+
+        for name in column_names:
+            column = getattr(self, name)
+            grown = numpy.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
+    def __controller_id(self, ip):
+        controller_id = self.controller_ids.get(ip)
+
+        if controller_id is None:
+            controller_id = len(self.controller_ips)
+            self.controller_ids[ip] = controller_id
+            self.controller_ips.append(ip)
+
+        return controller_id
+
+    def __remove_rows(self, controller_id):
+        # Close the gap left by a controller's rows and shift the later controllers down
+        start, count = self.ranges.pop(controller_id)
+
+        for name in column_names:
+            column = getattr(self, name)
+            column[start:self.size - count] = column[start + count:self.size]
+
+        self.size -= count
+        self.ranges = {other_id: (other_start - count if other_start > start else other_start, other_count)
+                       for other_id, (other_start, other_count) in self.ranges.items()}
+
+    def update(self, ip, fuse_block, timestamp=None):
+        """Updates a controller's rows in place from its fuse details and returns the number of changed fuses"""
+        timestamp = self.clock() if timestamp is None else timestamp
+        controller_id = self.__controller_id(ip)
+
+        # Zero-copy views of the fuse block columns
+        ports = numpy.frombuffer(fuse_block.port_ids, dtype=numpy.uint16) + 1
+        receivers = numpy.frombuffer(fuse_block.receivers, dtype=numpy.uint16)
+        states = numpy.frombuffer(fuse_block.states, dtype=numpy.int8)
+
+        known = self.ranges.get(controller_id)
+        if known is not None:
+            start, count = known
+            rows = slice(start, start + count)
+
+            # Same layout: compare and overwrite the states only
+            if count == len(states) and numpy.array_equal(self.port[rows], ports) and \
+                    numpy.array_equal(self.receiver[rows], receivers):
+                changed = self.state[rows] != states
+                self.changed_at[rows][changed] = timestamp
+                self.state[rows] = states
+
+                return int(numpy.count_nonzero(changed))
+
+            self.logger.info("Fuse layout of controller at '%s' changed, replacing its rows", ip)
+
+            # Fuses that are still reported keep the time of their last change
+            previous = {(int(port), int(receiver)): (int(state), float(changed_at))
+                        for port, receiver, state, changed_at in zip(self.port[rows], self.receiver[rows],
+                                                                     self.state[rows], self.changed_at[rows])}
+            self.__remove_rows(controller_id)
+        else:
+            previous = {}
+
+        # New controller (or new layout): append its rows
+        self.__reserve(len(states))
+        rows = slice(self.size, self.size + len(states))
+        self.controller[rows] = controller_id
+        self.port[rows] = ports
+        self.receiver[rows] = receivers
+        self.state[rows] = states
+        self.changed_at[rows] = timestamp
+        changed = len(states)
+
+        for row, key in enumerate(zip(ports.tolist(), receivers.tolist()), rows.start):
+            known_state, changed_at = previous.get(key, (None, None))
+
+            if known_state == self.state[row]:
+                self.changed_at[row] = changed_at
+                changed -= 1
+
+        self.ranges[controller_id] = (self.size, len(states))
+        self.size += len(states)
+
+        return changed
+
+    def mask(self, states=None, ips=None, ports=None, receivers=None, changed_since=None):
+        """Returns a boolean mask of the rows matching the given state(s), controller(s), port(s) and receiver(s)"""
+        mask = numpy.ones(self.size, dtype=bool)
+
+        if states is not None:
+            states = [states] if isinstance(states, (ControllerFuseState, int)) else states
+            mask &= column_matches(self.state[:self.size], [ControllerFuseState(state).value for state in states])
+
+        if ips is not None:
+            ips = [ips] if isinstance(ips, str) else ips
+            mask &= column_matches(self.controller[:self.size],
+                                   [self.controller_ids[ip] for ip in ips if ip in self.controller_ids])
+
+        if ports is not None:
+            mask &= column_matches(self.port[:self.size], [ports] if isinstance(ports, int) else list(ports))
+
+        if receivers is not None:
+            mask &= column_matches(self.receiver[:self.size],
+                                   [receivers] if isinstance(receivers, int) else list(receivers))
+
+        if changed_since is not None:
+            mask &= self.changed_at[:self.size] >= changed_since
+
+        return mask
+
+    def select(self, **filters):
+        """Returns the rows matching the filters (see mask()) as dicts"""
+        return self.to_rows(numpy.flatnonzero(self.mask(**filters)))
+
+    def tripped(self, ips=None):
+        """Returns every tripped fuse in the fleet"""
+        return self.select(states=ControllerFuseState.TRIPPED, ips=ips)
+
+    def count_by_state(self):
+        """Returns the number of fuses in each fuse state across the fleet"""
+        counts = numpy.bincount(self.state[:self.size] + state_code_offset, minlength=len(state_names))
+
+        return {fuse_states[code - state_code_offset]: int(count) for code, count in enumerate(counts)}
+
+    def count_by_controller(self, state=ControllerFuseState.TRIPPED):
+        """Returns the number of fuses in the given state per controller address"""
+        matching = self.controller[:self.size][self.state[:self.size] == ControllerFuseState(state).value]
+        counts = numpy.bincount(matching, minlength=len(self.controller_ips))
+
+        return {ip: int(count) for ip, count in zip(self.controller_ips, counts)}
+
+    def to_rows(self, rows=None):
+        rows = range(self.size) if rows is None else rows
+
+        return [{
+            'ip': self.controller_ips[self.controller[row]],
+            'port': int(self.port[row]),
+            'receiver': int(self.receiver[row]),
+            'state': fuse_states[int(self.state[row])],
+            'changed_at': float(self.changed_at[row]),
+        } for row in rows]
+
+    def to_dataframe(self):
+        """Returns the table as a pandas DataFrame (the numeric columns share the table's memory)"""
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("pandas is required for FleetStateTable.to_dataframe() (pip install pandas)")
+
+        return pandas.DataFrame({
+            'ip': pandas.Categorical.from_codes(self.controller[:self.size], categories=self.controller_ips),
+            'port': self.port[:self.size],
+            'receiver': self.receiver[:self.size],
+            'state': pandas.Categorical.from_codes(self.state[:self.size] + state_code_offset, categories=state_names),
+            'changed_at': self.changed_at[:self.size],
+        }, copy=False)
+
+    def to_arrow(self):
+        """Returns the table as a pyarrow Table (the numeric columns share the table's memory)"""
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("pyarrow is required for FleetStateTable.to_arrow() (pip install pyarrow)")
+
+        return pyarrow.table({
+            'ip': pyarrow.DictionaryArray.from_arrays(self.controller[:self.size].astype(numpy.int32),
+                                                      self.controller_ips),
+            'port': self.port[:self.size],
+            'receiver': self.receiver[:self.size],
+            'state': pyarrow.DictionaryArray.from_arrays(self.state[:self.size] + state_code_offset, state_names),
+            'changed_at': self.changed_at[:self.size],
+        })
@@ -0,0 +1,21 @@
+def format_value(value):
+    # Missing values are shown as '-' (enums show their name through __str__)
+    return '-' if value is None else str(value)
+
+
+def render_table(rows, columns=None):
+    """Renders a list of dicts as a right-aligned text table (columns default to the keys of the first row)"""
+    if columns is None:
+        columns = list(rows[0].keys()) if rows else []
+
+    if not columns:
+        return '(no rows)'
+
+    # Format every cell once, then size each column to its widest cell
+    cells = [[format_value(row.get(column)) for column in columns] for row in rows]
+    widths = [max([len(column)] + [len(line[index]) for line in cells]) for index, column in enumerate(columns)]
+
+    lines = [' '.join(column.rjust(width) for column, width in zip(columns, widths))]
+    lines.extend(' '.join(cell.rjust(width) for cell, width in zip(line, widths)) for line in cells)
+
+    return '\n'.join(lines)
@@ -0,0 +1,172 @@
+# Import libraries
+from .async_http import HTTPResponse
+import logging
+import asyncio
+import json
+
+# orjson is optional and only speeds up encoding payloads and decoding responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# JSON codec (compact bytes either way, so payloads are identical with and without orjson)
+if orjson is not None:
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+else:
+    def json_dumps(value):
+        return json.dumps(value, separators=(',', ':')).encode()
+
+    json_loads = json.loads
+
+# Headers of every API request
+api_headers = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}
+
+# Message type of every API method (Q: query, S: set)
+api_methods = {
+    'ST': 'Q',  # controller status (name and version)
+    'CQ': 'Q',  # fuse details
+    'TF': 'S',  # toggle one fuse
+    'FT': 'S',  # turn all fuses off / on
+    'FR': 'S',  # reset one / all tripped fuses
+}
+
+# Encoded payloads kept for reuse (method, message type and parameters repeat across a fleet)
+payload_cache = {}
+payload_cache_size = 4096
+
+
+def encode_payload(method, params=None, message_type=None):
+    """Returns the encoded request for a method code (reusing the payload encoded for the same parameters)"""
+    message_type = message_type or api_methods.get(method, 'S')
+    params = params or {}
+
+    try:
+        key = (method, message_type, tuple(params.items()))
+        payload = payload_cache.get(key)
+    except TypeError:
+        # Unhashable parameters (e.g. lists passed through the proxy) are encoded every time
+        key, payload = None, None
+
+    if payload is None:
+        payload = json_dumps({
+            "B": 0,
+            "E": 0,
+            "I": 0,
+            "M": method,
+            "P": params,
+            "T": message_type
+        })
+
+        if key is not None and len(payload_cache) < payload_cache_size:
+            payload_cache[key] = payload
+
+    return payload
+
+
+def read_response(response, ip, error_message, logger):
+    """Returns the response JSON, raising the same error for error statuses and unreadable bodies"""
+    # Check the status first: error bodies are not always JSON
+    if not response.ok:
+        try:
+            response_json = json_loads(response.content)
+        except ValueError:
+            response_json = None
+
+        if not isinstance(response_json, dict):
+            response_json = {"error": response.content.decode(errors='replace') or response.reason}
+
+        raise Exception("{} at '{}': {} - {}".format(
+            error_message,
+            ip,
+            response_json.get("translationKey", response.status_code),
+            response_json.get("error"))
+        )
+
+    try:
+        response_json = json_loads(response.content)
+    except ValueError as e:
+        raise Exception("{} at '{}': invalid response - {}".format(error_message, ip, e))
+
+    # Show response details
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(response.content.decode(errors='replace'))
+
+    return response_json
+
+
+# Class for a Blocking Transport over a pooled requests session
+class SessionTransport:
+    def __init__(self, session, url, timeout) -> None:
+        # Imported on first use, like requests itself in create_session()
+        from requests.exceptions import Timeout
+
+        self.session = session
+        self.url = url
+        self.timeout = timeout
+        self.timeout_errors = (Timeout, TimeoutError)  # recorded as timeouts in the metrics
+
+    def send(self, method, payload):
+        """Posts an encoded request and returns the response"""
+        return self.session.post(self.url, headers=api_headers, data=payload, timeout=self.timeout)
+
+    def close(self):
+        self.session.close()
+
+
+# Class for an Asynchronous Transport over a pooled AsyncHTTPClient
+class AsyncTransport:
+    timeout_errors = (asyncio.TimeoutError, TimeoutError)  # recorded as timeouts in the metrics
+
+    def __init__(self, client, path='/api') -> None:
+        self.client = client
+        self.path = path
+
+    async def send(self, method, payload):
+        """Posts an encoded request and returns the response"""
+        # Queries can safely be re-sent on a dropped keep-alive connection, commands cannot
+        return await self.client.request("POST", self.path, payload, api_headers,
+                                         idempotent=api_methods.get(method) == 'Q')
+
+    async def close(self):
+        await self.client.close()
+
+
+# Class for an In-Memory Transport (answers from an object with apply(method, params), e.g. a SimulatedController)
+class MemoryTransport:
+    timeout_errors = ()
+
+    def __init__(self, controller) -> None:
+        self.controller = controller
+        self.requests = []  # (method, payload) of every request sent
+
+    def send(self, method, payload):
+        """Answers an encoded request without any network I/O"""
+        self.requests.append((method, payload))
+
+        try:
+            request_json = json_loads(payload)
+            response_params = self.controller.apply(request_json.get("M"), request_json.get("P") or {})
+        except (ValueError, KeyError) as e:
+            return HTTPResponse(400, 'Bad Request', {}, json_dumps({"translationKey": "BAD_REQUEST", "error": str(e)}))
+
+        return HTTPResponse(200, 'OK', {}, json_dumps({"B": 0, "E": 0, "I": 0, "M": request_json.get("M"),
+                                                      "P": response_params, "T": "R"}))
+
+    def close(self):
+        pass
+
+
+# Class for an In-Memory Transport for AsyncController
+class AsyncMemoryTransport(MemoryTransport):
+    async def send(self, method, payload):
+        """Answers an encoded request without any network I/O"""
+        return MemoryTransport.send(self, method, payload)
+
+    async def close(self):
+        pass
@@ -0,0 +1,157 @@
+# Import libraries
+from dataclasses import dataclass
+from .controller_classes import ControllerFuseState
+import asyncio
+import logging
+import json
+import time
+
+
+# Default polling intervals (in seconds)
+watch_min_interval_default = 0.5
+watch_max_interval_default = 10.0
+
+
+# Class for a fuse state transition
+@dataclass
+class FuseEvent:
+    timestamp: float
+    ip: str
+    name: str
+    port: int
+    receiver: int
+    previous: ControllerFuseState
+    state: ControllerFuseState
+
+    @property
+    def tripped(self):
+        return self.state is ControllerFuseState.TRIPPED
+
+    def to_dict(self):
+        return {
+            'timestamp': self.timestamp,
+            'ip': self.ip,
+            'name': self.name,
+            'port': self.port,
+            'receiver': self.receiver,
+            'previous': str(self.previous) if self.previous else None,
+            'state': str(self.state) if self.state else None,
+        }
+
+
+# Class for an unbounded poll slot (contextlib.nullcontext only supports 'async with' from Python 3.10)
+class NoSlots:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+# Class for a Fuse State Watcher (polls one controller and emits state transitions)
+class FuseWatcher:
+    def __init__(self, controller, logger, callback, min_interval=watch_min_interval_default,
+                 max_interval=watch_max_interval_default, backoff=2.0, fuses=None, slots=None, recovery=None,
+                 history=None, state_table=None) -> None:
+        self.controller = controller
+        self.logger = logger
+        self.callback = callback
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.fuses = fuses
+        self.slots = slots or NoSlots()
+        self.recovery = recovery
+        self.history = history
+        self.state_table = state_table
+        self.interval = min_interval
+        self.fuse_block = None
+
+    async def poll(self):
+        """Queries the fuse details once and returns the transitions since the previous poll"""
+        first_poll = self.fuse_block is None
+
+        async with self.slots:
+            # The first poll also fetches the controller name for the events, later ones update the fuses in place
+            if first_poll:
+                await self.controller.refresh(details=not self.controller.details_loaded)
+                changes = []
+            else:
+                changes = await self.controller.get_controller_fuses()
+
+        self.fuse_block = self.controller.fuse_block
+
+        # Keep the change-only state history
+        if self.history is not None:
+            self.history.record(self.controller.ip, self.fuse_block)
+
+        # Keep the fleet-wide state table current
+        if self.state_table is not None:
+            self.state_table.update(self.controller.ip, self.fuse_block)
+
+        # The first poll only sets the baseline
+        if first_poll:
+            return []
+
+        timestamp = time.time()
+        events = [FuseEvent(timestamp, self.controller.ip, self.controller.name, port, receiver, previous_state, state)
+                  for port, receiver, previous_state, state in changes
+                  if self.fuses is None or (port, receiver) in self.fuses]
+
+        return events
+
+    def next_interval(self, changed):
+        # Poll quickly right after a change or trip, then slow down while the fuses are stable
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+
+        return self.interval
+
+    async def run(self):
+        """Polls until cancelled, passing every transition to the callback"""
+        while True:
+            recovered = []
+
+            try:
+                events = await self.poll()
+
+                for event in events:
+                    self.callback(event)
+
+                # Reset tripped fuses (re-checked quickly on the next poll)
+                if self.recovery is not None:
+                    async with self.slots:
+                        recovered = await self.recovery.recover(self.controller, self.fuses)
+            except Exception as e:
+                self.logger.warning("Polling controller at '%s' failed: %s", self.controller.ip, e)
+                events = []
+
+            await asyncio.sleep(self.next_interval(bool(events or recovered)))
+
+
+async def watch_fleet(controllers, logger, callback, concurrency=None, **watch_options):
+    """Watches several controllers until cancelled (at most `concurrency` polls in flight)"""
+    slots = asyncio.Semaphore(concurrency) if concurrency else None
+    watchers = [FuseWatcher(controller, logger, callback, slots=slots, **watch_options) for controller in controllers]
+
+    await asyncio.gather(*(watcher.run() for watcher in watchers))
+
+
+def stdout_event_writer(event):
+    # One JSON object per line
+    print(json.dumps(event.to_dict()), flush=True)
+
+
+def log_event_writer(logger):
+    def write_event(event):
+        level = logging.WARNING if event.tripped else logging.INFO
+        logger.log(level, "Fuse at Port: %s, Receiver: %s on '%s' changed from %s to %s",
+                   event.port,
+                   event.receiver,
+                   event.ip,
+                   event.previous,
+                   event.state)
+
+    return write_event
@@ -0,0 +1,28 @@
+# Import libraries
+from pyf16v5 import Controller, MemoryTransport
+from pyf16v5.simulator import SimulatedController
+import logging
+import pytest
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger('pyF16V5.tests')
+
+
+@pytest.fixture
+def simulator(logger):
+    """Simulated 4-port controller with every fuse on"""
+    return SimulatedController(logger, layout='4x1', seed=1)
+
+
+@pytest.fixture
+def controller(logger, simulator):
+    """Blocking Controller answered in memory by the simulator"""
+    with Controller('127.0.0.1', logger, 1, transport=MemoryTransport(simulator)) as memory_controller:
+        yield memory_controller
+
+
+def fuse_details(*fuses):
+    """CQ fuse details for (port, receiver, state) tuples (port counted from 1)"""
+    return [{"p": port - 1, "r": receiver, "f": state} for port, receiver, state in fuses]
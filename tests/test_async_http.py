@@ -0,0 +1,92 @@
+# Import libraries
+from pyf16v5.async_http import AsyncHTTPClient, read_request, write_response
+import asyncio
+import pytest
+
+
+async def start_server(dropped_requests):
+    """Keep-alive test server that closes the connection instead of answering the given request numbers"""
+    received = []
+
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+
+                received.append(request.content)
+                if len(received) in dropped_requests:
+                    break
+
+                write_response(writer, 200, b'{}')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle_connection, '127.0.0.1', 0)
+
+    return server, server.sockets[0].getsockname()[1], received
+
+
+def run_dropped_request(idempotent):
+    # The second request goes out on the pooled connection, which the server drops after reading it
+    async def run():
+        server, port, received = await start_server({2})
+
+        try:
+            async with AsyncHTTPClient('127.0.0.1', port, pool_size=1) as client:
+                await client.request('POST', '/api', b'first')
+
+                try:
+                    response = await client.request('POST', '/api', b'second', idempotent=idempotent)
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    response = e
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        return response, received
+
+    return asyncio.run(run())
+
+
+def test_non_idempotent_request_is_never_resent():
+    response, received = run_dropped_request(idempotent=False)
+
+    assert isinstance(response, (ConnectionError, asyncio.IncompleteReadError))
+    assert received == [b'first', b'second']
+
+
+def test_idempotent_request_is_resent_once_on_a_new_connection():
+    response, received = run_dropped_request(idempotent=True)
+
+    assert response.status_code == 200
+    assert received == [b'first', b'second', b'second']
+
+
+@pytest.mark.parametrize('idempotent', [False, True])
+def test_request_on_a_connection_closed_while_idle_is_sent_again(idempotent):
+    async def run():
+        server, port, received = await start_server(set())
+
+        try:
+            async with AsyncHTTPClient('127.0.0.1', port, pool_size=1) as client:
+                await client.request('POST', '/api', b'first')
+
+                # The controller dropped the idle keep-alive connection before the request was written
+                _, writer = client.idle_connections[0]
+                writer.transport.abort()
+                await asyncio.sleep(0)
+
+                response = await client.request('POST', '/api', b'second', idempotent=idempotent)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        return response, received
+
+    response, received = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert received == [b'first', b'second']
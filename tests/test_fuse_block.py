@@ -0,0 +1,81 @@
+# Import libraries
+from pyf16v5 import ControllerFuseBlock, ControllerFuseState
+from conftest import fuse_details
+
+good = ControllerFuseState.GOOD
+off = ControllerFuseState.OFF
+tripped = ControllerFuseState.TRIPPED
+
+
+def assert_matches_new_block(fuse_block, fuses, logger):
+    # A refreshed block must look exactly like one built from the same fuse details
+    fresh_block = ControllerFuseBlock(fuses, logger)
+
+    assert fuse_block.to_rows() == fresh_block.to_rows()
+    assert fuse_block.index == fresh_block.index
+
+
+def test_refresh_same_layout_reports_state_changes(logger):
+    fuse_block = ControllerFuseBlock(fuse_details((1, 0, 0), (2, 0, 0), (3, 0, 1)), logger)
+    fuse = fuse_block.find_fuse_in_block(2, 0)
+    fuses = fuse_details((1, 0, 0), (2, 0, 2), (3, 0, 1))
+
+    assert fuse_block.refresh(fuses) == [(2, 0, good, tripped)]
+    assert fuse.state is tripped
+    assert fuse_block.refresh(fuses) == []
+    assert_matches_new_block(fuse_block, fuses, logger)
+
+
+def test_refresh_with_added_receivers(logger):
+    fuse_block = ControllerFuseBlock(fuse_details((1, 0, 0), (2, 0, 1)), logger)
+    fuse = fuse_block.find_fuse_in_block(2, 0)
+    fuses = fuse_details((1, 0, 0), (1, 1, 1), (2, 0, 1), (2, 1, 2))
+
+    changes = fuse_block.refresh(fuses)
+
+    assert sorted(changes) == [(1, 1, None, off), (2, 1, None, tripped)]
+    assert fuse.state is off
+    assert fuse_block.find_fuse_in_block(2, 1).state is tripped
+    assert_matches_new_block(fuse_block, fuses, logger)
+
+
+def test_refresh_with_removed_receivers(logger):
+    fuse_block = ControllerFuseBlock(fuse_details((1, 0, 0), (1, 1, 2), (2, 0, 1)), logger)
+    removed_fuse = fuse_block.find_fuse_in_block(1, 1)
+    kept_fuse = fuse_block.find_fuse_in_block(2, 0)
+    fuses = fuse_details((1, 0, 0), (2, 0, 1))
+
+    assert fuse_block.refresh(fuses) == [(1, 1, tripped, None)]
+    assert kept_fuse.state is off
+    assert fuse_block.find_fuse_in_block(1, 1) is None
+    assert_matches_new_block(fuse_block, fuses, logger)
+
+    # Views of removed fuses read as unknown and ignore updates
+    assert removed_fuse.state is ControllerFuseState.UNKNOWN
+    removed_fuse.set_state(good)
+    assert_matches_new_block(fuse_block, fuses, logger)
+
+
+def test_refresh_with_reordered_receivers(logger):
+    fuse_block = ControllerFuseBlock(fuse_details((1, 0, 0), (1, 1, 1), (2, 0, 2)), logger)
+    views = {(fuse.port, fuse.receiver): fuse for fuse in fuse_block.fuses}
+    fuses = fuse_details((2, 0, 2), (1, 1, 1), (1, 0, 0))
+
+    assert fuse_block.refresh(fuses) == []
+    assert {key: fuse.state for key, fuse in views.items()} == {(1, 0): good, (1, 1): off, (2, 0): tripped}
+    assert_matches_new_block(fuse_block, fuses, logger)
+
+
+def test_refresh_with_reordered_and_changed_receivers(logger):
+    fuse_block = ControllerFuseBlock(fuse_details((1, 0, 0), (1, 1, 1), (2, 0, 2), (3, 0, 0)), logger)
+    fuses = fuse_details((3, 0, 2), (2, 0, 0), (4, 0, 1), (1, 0, 0))
+
+    changes = fuse_block.refresh(fuses)
+
+    assert sorted(changes, key=lambda change: change[:2]) == [
+        (1, 1, off, None),
+        (2, 0, tripped, good),
+        (3, 0, good, tripped),
+        (4, 0, None, off),
+    ]
+    assert_matches_new_block(fuse_block, fuses, logger)
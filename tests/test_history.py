@@ -0,0 +1,94 @@
+# Import libraries
+from collections import Counter
+from pyf16v5 import ControllerFuseBlock, ControllerFuseState, FuseHistory
+from conftest import fuse_details
+import pytest
+
+good = ControllerFuseState.GOOD
+off = ControllerFuseState.OFF
+tripped = ControllerFuseState.TRIPPED
+
+
+def block(logger, *states):
+    # One receiver per port, ports counted from 1
+    return ControllerFuseBlock(fuse_details(*((port, 0, state) for port, state in enumerate(states, 1))), logger)
+
+
+def test_history_round_trip(tmp_path, logger):
+    path = tmp_path / 'fuses.hist'
+
+    with FuseHistory(path, logger, snapshot_interval=100) as history:
+        assert history.record('10.0.0.1', block(logger, 0, 0, 1), timestamp=1000) == 3
+        assert history.record('10.0.0.2', block(logger, 0, 0), timestamp=1000) == 2
+
+        # Unchanged polls write nothing
+        assert history.record('10.0.0.1', block(logger, 0, 0, 1), timestamp=1010) == 0
+
+        assert history.record('10.0.0.1', block(logger, 2, 0, 1), timestamp=1020) == 1
+        assert history.record('10.0.0.2', block(logger, 0, 2), timestamp=1030) == 1
+        assert history.record('10.0.0.1', block(logger, 0, 0, 1), timestamp=1040) == 1
+        assert history.record('10.0.0.1', block(logger, 2, 0, 1), timestamp=1050) == 1
+
+    # Reopened, the history starts with a snapshot that continues from the last recorded states (no new trips)
+    with FuseHistory(path, logger, snapshot_interval=100) as history:
+        assert history.record('10.0.0.1', block(logger, 2, 0, 1), timestamp=1060) == 3
+
+        assert history.state_at(999) == {}
+        assert history.state_at(1025) == {
+            ('10.0.0.1', 1, 0): tripped,
+            ('10.0.0.1', 2, 0): good,
+            ('10.0.0.1', 3, 0): off,
+            ('10.0.0.2', 1, 0): good,
+            ('10.0.0.2', 2, 0): good,
+        }
+        assert history.state_at(1045, ip='10.0.0.2') == {('10.0.0.2', 1, 0): good, ('10.0.0.2', 2, 0): tripped}
+
+        assert history.trip_counts() == Counter({('10.0.0.1', 1, 0): 2, ('10.0.0.2', 2, 0): 1})
+        assert history.trip_counts(since=1025) == Counter({('10.0.0.1', 1, 0): 1, ('10.0.0.2', 2, 0): 1})
+        assert history.trips(ip='10.0.0.2') == [(1030, '10.0.0.2', 2, 0)]
+
+
+def test_snapshots_keep_old_states_reachable(tmp_path, logger):
+    path = tmp_path / 'fuses.hist'
+
+    with FuseHistory(path, logger, snapshot_interval=10) as history:
+        history.record('10.0.0.1', block(logger, 0, 1), timestamp=1000)
+        history.record('10.0.0.2', block(logger, 0), timestamp=1000)
+
+        # Only the first controller keeps polling (and snapshotting)
+        for timestamp in range(1010, 1100, 10):
+            assert history.record('10.0.0.1', block(logger, 0, 1), timestamp=timestamp) == 2
+
+    with FuseHistory(path, logger, read_only=True) as history:
+        assert history.state_at(1095) == {
+            ('10.0.0.1', 1, 0): good,
+            ('10.0.0.1', 2, 0): off,
+            ('10.0.0.2', 1, 0): good,
+        }
+
+
+def test_read_only_history_is_never_created_or_written(tmp_path, logger):
+    path = tmp_path / 'missing.hist'
+
+    with pytest.raises(Exception, match='does not exist'):
+        FuseHistory(path, logger, read_only=True)
+    assert not path.exists()
+
+    with FuseHistory(path, logger) as history:
+        history.record('10.0.0.1', block(logger, 0), timestamp=1000)
+    size = path.stat().st_size
+
+    with FuseHistory(path, logger, read_only=True) as history:
+        assert history.state_at(1000) == {('10.0.0.1', 1, 0): good}
+
+        with pytest.raises(Exception, match='not open for recording'):
+            history.record('10.0.0.1', block(logger, 2), timestamp=1010)
+    assert path.stat().st_size == size
+
+
+def test_other_files_are_rejected(tmp_path, logger):
+    path = tmp_path / 'notes.txt'
+    path.write_text('not a history')
+
+    with pytest.raises(Exception, match='not a version 1 fuse history file'):
+        FuseHistory(path, logger, read_only=True)
@@ -0,0 +1,80 @@
+# Import libraries
+from pyf16v5 import ControllerFuseBlock, ControllerFuseState, plan_command
+from conftest import fuse_details
+import pytest
+
+good = ControllerFuseState.GOOD.value
+off = ControllerFuseState.OFF.value
+tripped = ControllerFuseState.TRIPPED.value
+
+
+def sent_methods(controller):
+    # Requests after the fuse details were loaded
+    return [method for method, _ in controller.transport.requests if method not in ('ST', 'CQ')]
+
+
+def test_bulk_request_when_it_changes_exactly_the_selected_fuses(controller, simulator):
+    for key in simulator.fuses:
+        simulator.fuses[key] = off
+
+    plan = plan_command('on', None, controller.fuse_block)
+
+    assert [call.bulk for call in plan.calls] == [True]
+    assert len(plan.calls[0].fuses) == 4
+
+    plan.execute_sync(controller)
+
+    assert sent_methods(controller) == ['FT']
+    assert set(simulator.fuses.values()) == {good}
+
+
+def test_single_requests_when_a_bulk_request_would_touch_other_fuses(controller, simulator):
+    for key in simulator.fuses:
+        simulator.fuses[key] = off
+
+    selected = controller.fuse_block.select(ports=[1, 2])
+    plan = plan_command('on', selected, controller.fuse_block)
+
+    assert [call.bulk for call in plan.calls] == [False, False]
+    assert [call.fuses[0].port for call in plan.calls] == [1, 2]
+
+    plan.execute_sync(controller)
+
+    assert sent_methods(controller) == ['TF', 'TF']
+    assert [simulator.fuses[(port_id, 0)] for port_id in range(4)] == [good, good, off, off]
+
+
+def test_single_request_for_one_fuse(controller, simulator):
+    simulator.fuses[(2, 0)] = tripped
+
+    plan = plan_command('reset', None, controller.fuse_block)
+
+    assert [call.bulk for call in plan.calls] == [False]
+    assert plan.calls[0].fuses[0].port == 3
+    assert len(plan.skipped) == 3
+
+
+def test_fuses_already_in_the_target_state_are_skipped(controller):
+    plan = plan_command('on', None, controller.fuse_block)
+
+    assert plan.calls == []
+    assert len(plan.skipped) == 4
+
+
+def test_no_bulk_request_while_a_fuse_state_is_unknown(logger):
+    fuse_block = ControllerFuseBlock(fuse_details((1, 0, off), (2, 0, off), (3, 0, ControllerFuseState.UNKNOWN.value)),
+                                     logger)
+
+    plan = plan_command('on', fuse_block.select(ControllerFuseState.OFF), fuse_block)
+
+    assert [call.bulk for call in plan.calls] == [False, False]
+
+
+def test_blind_bulk_request_without_fuse_details():
+    plan = plan_command('off')
+
+    assert len(plan.calls) == 1
+    assert plan.calls[0].bulk and plan.calls[0].fuses is None
+
+    with pytest.raises(ValueError):
+        plan_command('off', [])
@@ -0,0 +1,112 @@
+# Import libraries
+from pyf16v5 import AsyncMemoryTransport
+from pyf16v5.proxy import CachingProxy
+from pyf16v5.simulator import SimulatedController
+from pyf16v5.transport import json_loads
+import asyncio
+
+ip = '10.0.0.1'
+
+
+# Class for an In-Memory Transport that answers fuse queries at once but holds the response until released
+class HeldQueryTransport(AsyncMemoryTransport):
+    def __init__(self, controller) -> None:
+        super().__init__(controller)
+        self.release = asyncio.Event()
+
+    async def send(self, method, payload):
+        response = await super().send(method, payload)
+
+        if method == 'CQ':
+            await self.release.wait()
+
+        return response
+
+    def count(self, method):
+        return sum(1 for sent_method, _ in self.requests if sent_method == method)
+
+
+def start_proxy(logger, ttl=60.0):
+    # The proxy's controller client answers from a simulator instead of the network
+    simulator = SimulatedController(logger, layout='2x1')
+    proxy = CachingProxy(logger, ttl=ttl)
+    transport = HeldQueryTransport(simulator)
+    proxy.controller(ip).transport = transport
+
+    return proxy, transport
+
+
+async def sent(transport, method, count):
+    # Let the proxy's tasks run until `count` requests of the method went upstream
+    while transport.count(method) < count:
+        await asyncio.sleep(0)
+
+
+def fuse_states(body):
+    return [fuse["f"] for fuse in json_loads(body)["P"]["A"]]
+
+
+def test_concurrent_queries_share_one_upstream_request(logger):
+    async def run():
+        proxy, transport = start_proxy(logger)
+
+        queries = [asyncio.ensure_future(proxy.query(ip, 'CQ')) for _ in range(5)]
+        await sent(transport, 'CQ', 1)
+        transport.release.set()
+        bodies = await asyncio.gather(*queries)
+
+        # Answered from the cache afterwards
+        assert await proxy.query(ip, 'CQ') == bodies[0]
+
+        return transport.count('CQ'), bodies, proxy.stats
+
+    count, bodies, stats = asyncio.run(run())
+
+    assert count == 1
+    assert len(set(bodies)) == 1
+    assert (stats['misses'], stats['coalesced'], stats['hits']) == (1, 4, 1)
+
+
+def test_write_invalidates_cached_fuse_details(logger):
+    async def run():
+        proxy, transport = start_proxy(logger)
+        transport.release.set()
+
+        before = await proxy.query(ip, 'CQ')
+        await proxy.write(ip, 'TF', {"P": 0, "R": 0}, 'S')
+        after = await proxy.query(ip, 'CQ')
+
+        return transport.count('CQ'), before, after
+
+    count, before, after = asyncio.run(run())
+
+    assert count == 2
+    assert fuse_states(before) == [0, 0]
+    assert fuse_states(after) == [1, 0]
+
+
+def test_queries_after_a_write_do_not_join_an_older_request(logger):
+    async def run():
+        proxy, transport = start_proxy(logger)
+
+        # A fuse query is in flight (already answered upstream) when the write goes out
+        stale_query = asyncio.ensure_future(proxy.query(ip, 'CQ'))
+        await sent(transport, 'CQ', 1)
+        await proxy.write(ip, 'TF', {"P": 1, "R": 0}, 'S')
+        fresh_query = asyncio.ensure_future(proxy.query(ip, 'CQ'))
+        await sent(transport, 'CQ', 2)
+
+        transport.release.set()
+        stale, fresh = await asyncio.gather(stale_query, fresh_query)
+
+        # Only the response sent after the write is cached
+        cached = await proxy.query(ip, 'CQ')
+
+        return transport.count('CQ'), stale, fresh, cached
+
+    count, stale, fresh, cached = asyncio.run(run())
+
+    assert count == 2
+    assert fuse_states(stale) == [0, 0]
+    assert fuse_states(fresh) == [0, 1]
+    assert cached == fresh